@@ -7,11 +7,32 @@ Markers (inserted deterministically by insert_section_markers):
   % PROJECTS_START / % PROJECTS_END  (with % PROJECT:name sub-markers)
 """
 
+import hashlib
 import re
+import sys
+from collections.abc import Iterable
+from functools import lru_cache
 
 from app.models import ResumeSections
 from app.core.logger import logger
 
+# In-memory cache: SHA-256(tex) → parsed sections.
+# The same marked .tex is re-parsed across requests (e.g. one resume, many JDs).
+_sections_cache: dict[str, ResumeSections] = {}
+_MAX_CACHE = 20
+
+# Cache for get_skills_on_resume keyed by the (category, content) pairs.
+# Parse-cache hits hand back the same str objects, whose hashes are cached.
+_skills_cache: dict[tuple[tuple[str, str], ...], dict[str, list[str]]] = {}
+
+# Any top-level START/END marker line, e.g. "% SKILLS_START"
+_SECTION_MARKER_RE = re.compile(
+    r"^% (SUMMARY|SKILLS|EXPERIENCE|PROJECTS)_(START|END)[^\S\n]*$", re.MULTILINE,
+)
+
+# Skills inside \skillline{Category}{THESE, SKILLS}
+_SKILLLINE_RE = re.compile(r"\\skillline\{[^}]*\}\{([^}]*)\}")
+
 # ── Section title → marker type mapping ────────────────────────────────────
 _TITLE_TO_MARKER: dict[str, str] = {
     "summary": "SUMMARY",
@@ -156,44 +177,98 @@ def _mark_content(content: str, marker_type: str) -> str:
     return content
 
 
+@lru_cache(maxsize=16)
+def _sub_marker_re(prefix: str) -> re.Pattern[str]:
+    """Compiled sub-marker line pattern (e.g. '% SKILL_CAT:name'), built once per prefix."""
+    return re.compile(rf"^% {re.escape(prefix)}:(\S+)[^\n]*", re.MULTILINE)
+
+
+@lru_cache(maxsize=32)
+def _marker_pair_re(start_marker: str, end_marker: str) -> re.Pattern[str]:
+    """Compiled START/END marker-line pattern; group 1 is set on START lines."""
+    return re.compile(
+        rf"^(?:({re.escape(start_marker)})|{re.escape(end_marker)})[^\S\n]*$", re.MULTILINE,
+    )
+
+
+def _pair_markers(tex: str, markers: Iterable[tuple[str, bool, re.Match[str]]]) -> dict[str, str]:
+    """Slice the content of each marked block out of tex.
+
+    ``markers`` yields (name, is_start, match) for every marker line in order.
+    Each name pairs its first START line with the first END line after it.
+    Content begins on the line after START, skipping blank lines directly
+    after it; a START on the last line (no line break) opens nothing.
+    """
+    open_at: dict[str, int] = {}
+    found: dict[str, str] = {}
+    for name, is_start, m in markers:
+        if name in found:
+            continue
+        if is_start:
+            if name not in open_at:
+                ws_end = m.end()
+                while ws_end < len(tex) and tex[ws_end].isspace():
+                    ws_end += 1
+                # -1 (no line break) + 1 == 0 marks the block as unopened
+                open_at[name] = tex.rfind("\n", m.end(), ws_end) + 1
+        elif open_at.get(name):
+            found[name] = tex[open_at[name]:m.start()]
+    return found
+
+
 def extract_between_markers(tex: str, start_marker: str, end_marker: str) -> str:
     """Extract content between two comment markers (exclusive of markers)."""
-    pattern = re.compile(
-        rf"^{re.escape(start_marker)}\s*$\n(.*?)^{re.escape(end_marker)}\s*$",
-        re.DOTALL | re.MULTILINE,
+    markers = (
+        (start_marker, m.group(1) is not None, m)
+        for m in _marker_pair_re(start_marker, end_marker).finditer(tex)
     )
-    m = pattern.search(tex)
-    if m:
-        return m.group(1)
+    content = _pair_markers(tex, markers).get(start_marker)
+    if content is not None:
+        return content
     logger.warning(f"Markers not found: {start_marker} ... {end_marker}")
     return ""
 
 
 def _parse_sub_blocks(content: str, prefix: str) -> dict[str, str]:
     """Parse content into named blocks using sub-markers like % SKILL_CAT:name."""
+    markers = list(_sub_marker_re(prefix).finditer(content))
     blocks = {}
-    current_name = None
-    current_lines = []
-
-    for line in content.split("\n"):
-        match = re.match(rf"^% {re.escape(prefix)}:(\S+)", line)
-        if match:
-            if current_name is not None:
-                blocks[current_name] = "\n".join(current_lines)
-            current_name = match.group(1)
-            current_lines = []
-        elif current_name is not None:
-            current_lines.append(line)
-
-    if current_name is not None:
-        blocks[current_name] = "\n".join(current_lines)
+    # Each block runs from the line after its marker to the line break before
+    # the next marker; text before the first marker is never sliced.
+    for i, m in enumerate(markers):
+        start = m.end() + 1
+        stop = markers[i + 1].start() - 1 if i + 1 < len(markers) else len(content)
+        # Names like "languages" recur across every resume — share one copy.
+        blocks[sys.intern(m.group(1))] = content[start:stop]
 
     return blocks
 
 
+def _extract_marked_sections(tex: str) -> dict[str, str]:
+    """Extract every top-level marked section in a single pass over tex.
+
+    Pairs markers exactly as extract_between_markers does. Returns
+    {"SKILLS": content, ...} for the sections that were found.
+    """
+    markers = ((m.group(1), m.group(2) == "START", m) for m in _SECTION_MARKER_RE.finditer(tex))
+    return _pair_markers(tex, markers)
+
+
+def _copy_sections(sections: ResumeSections) -> ResumeSections:
+    """Copy the nested dicts so callers can't mutate a cached result."""
+    return {
+        "summary": sections["summary"],
+        "skills": dict(sections["skills"]),
+        "experience": dict(sections["experience"]),
+        "projects": dict(sections["projects"]),
+    }
+
+
 def parse_resume_sections(tex: str) -> ResumeSections:
     """Parse a .tex file into named sections.
 
+    Results are cached by content hash — the same .tex skips re-parsing.
+
     Args:
         tex: The LaTeX content to parse (with comment markers).
 
@@ -205,6 +280,11 @@ def parse_resume_sections(tex: str) -> ResumeSections:
             "projects": {"project_name": "\\projectentry{...}", ...},
         }
     """
+    content_hash = hashlib.sha256(tex.encode()).hexdigest()
+    if content_hash in _sections_cache:
+        logger.debug(f"Parse cache HIT (hash={content_hash[:8]}...)")
+        return _copy_sections(_sections_cache[content_hash])
+
     sections: ResumeSections = {
         "summary": "",
         "skills": {},
@@ -212,16 +292,15 @@ def parse_resume_sections(tex: str) -> ResumeSections:
         "projects": {},
     }
 
-    sections["summary"] = extract_between_markers(tex, "% SUMMARY_START", "% SUMMARY_END").strip()
-
-    skills_content = extract_between_markers(tex, "% SKILLS_START", "% SKILLS_END")
-    sections["skills"] = _parse_sub_blocks(skills_content, "SKILL_CAT")
+    marked = _extract_marked_sections(tex)
+    for name in ("SUMMARY", "SKILLS", "EXPERIENCE", "PROJECTS"):
+        if name not in marked:
+            logger.warning(f"Markers not found: % {name}_START ... % {name}_END")
 
-    exp_content = extract_between_markers(tex, "% EXPERIENCE_START", "% EXPERIENCE_END")
-    sections["experience"] = _parse_sub_blocks(exp_content, "EXP")
-
-    projects_content = extract_between_markers(tex, "% PROJECTS_START", "% PROJECTS_END")
-    sections["projects"] = _parse_sub_blocks(projects_content, "PROJECT")
+    sections["summary"] = marked.get("SUMMARY", "").strip()
+    sections["skills"] = _parse_sub_blocks(marked.get("SKILLS", ""), "SKILL_CAT")
+    sections["experience"] = _parse_sub_blocks(marked.get("EXPERIENCE", ""), "EXP")
+    sections["projects"] = _parse_sub_blocks(marked.get("PROJECTS", ""), "PROJECT")
 
     logger.debug(
         f"Parsed: {len(sections['skills'])} skill cats, "
@@ -229,21 +308,35 @@ def parse_resume_sections(tex: str) -> ResumeSections:
         f"{len(sections['experience'])} experience entries"
     )
 
-    return sections
+    if len(_sections_cache) >= _MAX_CACHE:
+        oldest_key = next(iter(_sections_cache))
+        del _sections_cache[oldest_key]
+    _sections_cache[content_hash] = sections
+
+    return _copy_sections(sections)
 
 
 def get_skills_on_resume(sections: ResumeSections) -> dict[str, list[str]]:
     """Extract the list of skill keywords currently on the resume per category.
 
     Parses the \\skillline{Category}{skill1, skill2, ...} lines.
+    Results are cached per skills content — the same resume skips re-parsing.
     """
-    skills_on_resume = {}
-    for cat, content in sections.get("skills", {}).items():
-        # Match the skills inside \skillline{...}{THESE SKILLS}
-        m = re.search(r"\\skillline\{[^}]*\}\{([^}]*)\}", content)
-        if m:
-            raw = m.group(1)
-            skills_on_resume[cat] = [s.strip() for s in raw.split(",") if s.strip()]
-        else:
-            skills_on_resume[cat] = []
-    return skills_on_resume
+    key = tuple(sections.get("skills", {}).items())
+    skills_on_resume = _skills_cache.get(key)
+    if skills_on_resume is None:
+        skills_on_resume = {}
+        for cat, content in key:
+            m = _SKILLLINE_RE.search(content)
+            if m:
+                raw = m.group(1)
+                skills_on_resume[cat] = [s.strip() for s in raw.split(",") if s.strip()]
+            else:
+                skills_on_resume[cat] = []
+
+        if len(_skills_cache) >= _MAX_CACHE:
+            oldest_key = next(iter(_skills_cache))
+            del _skills_cache[oldest_key]
+        _skills_cache[key] = skills_on_resume
+
+    return {cat: list(skills) for cat, skills in skills_on_resume.items()}
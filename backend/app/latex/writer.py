@@ -16,6 +16,10 @@ _LATEX_SPECIAL = {
 }
 # Regex matching any single special character above.
 _LATEX_ESCAPE_RE = re.compile("|".join(re.escape(c) for c in _LATEX_SPECIAL))
+# Trailing LaTeX line break (\\) at the end of a skills entry.
+_TRAILING_BREAK_RE = re.compile(r"\s*\\\\\s*$")
+# \skillline{Category}{skills} — group 1 is the prefix up to the skills list.
+_SKILLLINE_RE = re.compile(r"(\\skillline\{[^}]*\}\{)([^}]*)\}")
 
 
 def escape_latex(text: str) -> str:
@@ -64,19 +68,23 @@ def rebuild_skills_section(
         content = skills_dict[cat].strip()
 
         # Strip trailing \\ — we re-add them between entries below
-        content = re.sub(r"\s*\\\\\s*$", "", content)
+        content = _TRAILING_BREAK_RE.sub("", content)
 
         # Inject keywords into the \skillline{...}{THESE} content
         if injectable.get(cat):
             # Find the \skillline and append new keywords before the closing }
-            m = re.search(r"(\\skillline\{[^}]*\}\{)([^}]*)\}", content)
+            m = _SKILLLINE_RE.search(content)
             if m:
                 existing = m.group(2)
+                # One lowercased set per category — O(1) membership per keyword.
+                # Updated as we go so repeats within injectable are skipped too.
                 existing_lower = {s.strip().lower() for s in existing.split(",")}
-                new_keywords = [
-                    kw for kw in injectable[cat]
-                    if kw.lower() not in existing_lower
-                ]
+                new_keywords = []
+                for kw in injectable[cat]:
+                    kw_lower = kw.lower()
+                    if kw_lower not in existing_lower:
+                        existing_lower.add(kw_lower)
+                        new_keywords.append(kw)
                 if new_keywords:
                     escaped = [escape_latex(kw) for kw in new_keywords]
                     updated = existing.rstrip() + ", " + ", ".join(escaped)
@@ -86,15 +94,7 @@ def rebuild_skills_section(
         entries.append((cat, content))
 
     # Rebuild with \\ between each entry (not after the last one)
-    lines = []
-    for i, (cat, content) in enumerate(entries):
-        lines.append(f"% SKILL_CAT:{cat}")
-        if i < len(entries) - 1:
-            lines.append(content + " \\\\")
-        else:
-            lines.append(content)
-
-    return "\n".join(lines)
+    return " \\\\\n".join(f"% SKILL_CAT:{cat}\n{content}" for cat, content in entries)
 
 
 def rebuild_projects_section(
@@ -102,12 +102,9 @@ def rebuild_projects_section(
     project_order: list[str],
 ) -> str:
     """Rebuild projects section in the specified order."""
-    blocks = []
-    for proj in project_order:
-        if proj not in projects_dict:
-            continue
-        blocks.append(f"% PROJECT:{proj}")
-        blocks.append(projects_dict[proj].strip())
-        blocks.append("")  # blank line between projects
-
-    return "\n".join(blocks).rstrip()
+    # Blank line between projects
+    return "\n\n".join(
+        f"% PROJECT:{proj}\n{projects_dict[proj].strip()}"
+        for proj in project_order
+        if proj in projects_dict
+    ).rstrip()
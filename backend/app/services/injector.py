@@ -77,14 +77,21 @@ def inject_into_latex(
                 modified_tex, "% SUMMARY_START", "% SUMMARY_END", new_summary
             )
 
-    # Generate unified diff
-    diff = difflib.unified_diff(
-        original_tex.splitlines(keepends=True),
-        modified_tex.splitlines(keepends=True),
-        fromfile="resume_base.tex",
-        tofile="resume_tailored.tex",
-    )
-    tex_diff = "".join(diff)
+    # Generate unified diff (line-based; skip SequenceMatcher when nothing changed)
+    if modified_tex == original_tex:
+        tex_diff = ""
+    else:
+        # difflib must get lists of lines — a raw str degrades to a
+        # character-level diff that is far slower and unreadable.
+        base_lines = original_tex.splitlines(keepends=True)
+        tailored_lines = modified_tex.splitlines(keepends=True)
+        diff = difflib.unified_diff(
+            base_lines,
+            tailored_lines,
+            fromfile="resume_base.tex",
+            tofile="resume_tailored.tex",
+        )
+        tex_diff = "".join(diff)
 
     changes = tex_diff.count("\n+") + tex_diff.count("\n-")
     logger.info(f"Injection complete: ~{changes} lines changed")
@@ -110,10 +110,7 @@ async def match_keywords(
     )
 
 
-def _format_skills_dict(skills: dict) -> str:
+def _format_skills_dict(skills: dict[str, list[str]]) -> str:
     """Format a skills dict into a readable string for the LLM."""
-    lines = []
-    for cat, items in skills.items():
-        if items:
-            lines.append(f"  {cat}: {', '.join(items)}")
+    lines = [f"  {cat}: {', '.join(items)}" for cat, items in skills.items() if items]
     return "\n".join(lines) if lines else "  (none)"
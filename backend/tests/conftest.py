@@ -1,19 +1,30 @@
 """Shared fixtures for resume-tailor backend tests."""
 
-import os
-import sys
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from unittest.mock import AsyncMock
 
 import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
 from app.main import app
 from app.routes import tailor as tailor_route
 
 
-@pytest.fixture(autouse=True)
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
+if uvloop is not None:
+    def pytest_asyncio_loop_factories(config, item):
+        """Drive async tests with uvloop instead of the default selector loop."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(scope="session", autouse=True)
 def _disable_rate_limiter():
-    """Disable slowapi rate limiting for all tests."""
+    """Disable slowapi rate limiting once for the whole test session."""
     app.state.limiter.enabled = False
     tailor_route.limiter.enabled = False
     yield
@@ -22,15 +33,54 @@ def _disable_rate_limiter():
 
 
 @pytest.fixture(autouse=True)
-def _clear_llm_caches():
-    """Clear in-memory LLM caches between tests to prevent interference."""
+def _clear_caches():
+    """Clear in-memory LLM and parser caches between tests to prevent interference."""
     from app.services.resume_analyzer import _analysis_cache
     from app.services.extractor import _extraction_cache
+    from app.latex.parser import _sections_cache, _skills_cache
     _analysis_cache.clear()
     _extraction_cache.clear()
+    _sections_cache.clear()
+    _skills_cache.clear()
     yield
     _analysis_cache.clear()
     _extraction_cache.clear()
+    _sections_cache.clear()
+    _skills_cache.clear()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client():
+    """Async httpx client wired to the app via ASGI transport, shared per module.
+
+    Tests using it must run on the module loop — the default set by
+    ``asyncio_default_test_loop_scope`` in pyproject.toml.
+    """
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture(scope="module")
+def sync_client():
+    """Sync TestClient for guard-path tests that need no event loop of their own."""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def _shared_llm_mock():
+    """LLM client mock built once per session; tests get it through mock_llm."""
+    return AsyncMock()  # children (call_json) are AsyncMocks too
+
+
+@pytest.fixture
+def mock_llm(_shared_llm_mock):
+    """The shared LLM client mock, with calls, return value and side effect cleared."""
+    call_json = _shared_llm_mock.call_json
+    call_json.reset_mock(return_value=True, side_effect=True)
+    call_json.return_value = None
+    return _shared_llm_mock
 
 
 from app.models import (
@@ -74,6 +124,9 @@ AI/LLM Engineer with 4+ years of experience.
 \end{document}
 """.strip()
 
+# Pre-encoded upload body — saves re-encoding SAMPLE_TEX for every request.
+SAMPLE_TEX_BYTES = SAMPLE_TEX.encode("utf-8")
+
 
 SAMPLE_JD = (
     "We are looking for a Senior Backend Engineer with experience in Python, "
@@ -1,8 +1,5 @@
 """Tests for app/services/compiler.py — _slugify and filename generation."""
 
-import os, sys
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import re
 import pytest
 
@@ -140,14 +137,19 @@ class TestSlugifyEdgeCases:
 # _slugify — truncation (max_len)
 # ---------------------------------------------------------------------------
 
+_LONG_A = "A" * 200
+_BOUNDARY_X = "x" * FILENAME_MAX_SLUG_LENGTH
+_OVER_BOUNDARY_X = "x" * (FILENAME_MAX_SLUG_LENGTH + 1)
+_AB_DOT = "ab." * 40  # 120 chars raw, 80 after stripping dots
+
+
 class TestSlugifyTruncation:
     """Output must not exceed max_len (default FILENAME_MAX_SLUG_LENGTH = 50)."""
 
     def test_long_string_truncated_to_default(self):
-        long_input = "A" * 200
-        result = _slugify(long_input)
+        result = _slugify(_LONG_A)
         assert len(result) == FILENAME_MAX_SLUG_LENGTH
-        assert result == "A" * FILENAME_MAX_SLUG_LENGTH
+        assert result == _LONG_A[:FILENAME_MAX_SLUG_LENGTH]
 
     def test_custom_max_len(self):
         result = _slugify("Hello World This Is Long", max_len=10)
@@ -158,17 +160,14 @@ class TestSlugifyTruncation:
         assert _slugify("anything", max_len=0) == ""
 
     def test_exact_boundary_length(self):
-        input_text = "x" * FILENAME_MAX_SLUG_LENGTH
-        assert len(_slugify(input_text)) == FILENAME_MAX_SLUG_LENGTH
+        assert len(_slugify(_BOUNDARY_X)) == FILENAME_MAX_SLUG_LENGTH
 
     def test_one_over_boundary(self):
-        input_text = "x" * (FILENAME_MAX_SLUG_LENGTH + 1)
-        assert len(_slugify(input_text)) == FILENAME_MAX_SLUG_LENGTH
+        assert len(_slugify(_OVER_BOUNDARY_X)) == FILENAME_MAX_SLUG_LENGTH
 
     def test_stripping_happens_before_truncation(self):
-        # 60 chars with interspersed dots: dots are stripped first, then truncate
-        input_text = ("ab." * 40)  # 120 chars raw, 80 after stripping dots
-        result = _slugify(input_text)
+        # Interspersed dots: dots are stripped first, then truncate
+        result = _slugify(_AB_DOT)
         assert len(result) == FILENAME_MAX_SLUG_LENGTH
         assert "." not in result
 
@@ -4,29 +4,31 @@ All LLM-dependent services are mocked — these test request validation,
 error handling, and response shape without making real API calls.
 """
 
-import os
-import sys
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from io import BytesIO
 from unittest.mock import AsyncMock, patch, MagicMock
 
+import orjson
 import pytest
 from httpx import ASGITransport, AsyncClient
 
 from app.main import app
 from app.models import ResumeAnalysis, ExtractedKeywords, MatchResult, ReorderPlan
-from tests.conftest import SAMPLE_TEX, SAMPLE_JD
+from tests.conftest import SAMPLE_TEX, SAMPLE_TEX_BYTES, SAMPLE_JD
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _tex_upload(content: str = SAMPLE_TEX, filename: str = "resume.tex") -> dict:
-    """Build the multipart file dict for httpx."""
-    return {"resume_file": (filename, BytesIO(content.encode()), "application/x-tex")}
+def _tex_upload(content: str | None = None, filename: str = "resume.tex") -> dict:
+    """Build the multipart file dict for httpx (defaults to SAMPLE_TEX)."""
+    body = SAMPLE_TEX_BYTES if content is None else content.encode()
+    return {"resume_file": (filename, BytesIO(body), "application/x-tex")}
+
+
+def _json(resp) -> dict:
+    """Decode a JSON response body straight from bytes."""
+    return orjson.loads(resp.content)
 
 
 def _form_data(jd_text: str = SAMPLE_JD, **extra) -> dict:
@@ -111,57 +113,52 @@ def _patch_all():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 class TestEndpointValidation:
-    """Request validation tests — no mocks needed for most of these."""
+    """Request validation tests — rejected before any pipeline step runs.
+
+    These never await a service, so they use the synchronous ``TestClient``
+    instead of spinning up an ``AsyncClient`` per test.
+    """
 
-    async def test_missing_file_returns_422(self):
+    def test_missing_file_returns_422(self, sync_client):
         """No resume_file attached → 422."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.post("/api/tailor", data=_form_data())
+        resp = sync_client.post("/api/tailor", data=_form_data())
         assert resp.status_code == 422
 
-    async def test_non_tex_file_returns_400(self):
+    def test_non_tex_file_returns_400(self, sync_client):
         """A .pdf upload → 400."""
         patches = _patch_all()
         with patches["analyze"], patches["extract"], patches["match"], \
              patches["reorder"], patches["inject"], patches["compile"], patches["flush"]:
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-                resp = await client.post(
-                    "/api/tailor",
-                    data=_form_data(),
-                    files=_tex_upload(filename="resume.pdf"),
-                )
+            resp = sync_client.post(
+                "/api/tailor",
+                data=_form_data(),
+                files=_tex_upload(filename="resume.pdf"),
+            )
         assert resp.status_code == 400
-        assert "tex" in resp.json()["detail"].lower()
+        assert "tex" in _json(resp)["detail"].lower()
 
-    async def test_empty_jd_returns_422(self):
+    def test_empty_jd_returns_422(self, sync_client):
         """JD shorter than min_length → 422."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.post(
-                "/api/tailor",
-                data=_form_data(jd_text="too short"),
-                files=_tex_upload(),
-            )
+        resp = sync_client.post(
+            "/api/tailor",
+            data=_form_data(jd_text="too short"),
+            files=_tex_upload(),
+        )
         assert resp.status_code == 422
 
-    async def test_tiny_tex_returns_400(self):
+    def test_tiny_tex_returns_400(self, sync_client):
         """A .tex file with almost no content → 400."""
         patches = _patch_all()
         with patches["analyze"], patches["extract"], patches["match"], \
              patches["reorder"], patches["inject"], patches["compile"], patches["flush"]:
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-                resp = await client.post(
-                    "/api/tailor",
-                    data=_form_data(),
-                    files=_tex_upload(content="hi"),
-                )
+            resp = sync_client.post(
+                "/api/tailor",
+                data=_form_data(),
+                files=_tex_upload(content="hi"),
+            )
         assert resp.status_code == 400
-        assert "small" in resp.json()["detail"].lower()
+        assert "small" in _json(resp)["detail"].lower()
 
 
 # ---------------------------------------------------------------------------
@@ -197,7 +194,7 @@ class TestEndpointHappyPath:
                     data=_form_data(),
                     files=_tex_upload(),
                 )
-        body = resp.json()
+        body = _json(resp)
         assert "extracted" in body
         assert "match" in body
         assert "reorder_plan" in body
@@ -216,7 +213,7 @@ class TestEndpointHappyPath:
                     data=_form_data(),
                     files=_tex_upload(),
                 )
-        body = resp.json()
+        body = _json(resp)
         assert body["match"]["match_score"] == 75
 
     async def test_pdf_url_in_response(self):
@@ -230,7 +227,7 @@ class TestEndpointHappyPath:
                     data=_form_data(),
                     files=_tex_upload(),
                 )
-        body = resp.json()
+        body = _json(resp)
         assert body["pdf_url"].endswith(".pdf")
 
 
@@ -259,7 +256,7 @@ class TestEndpointServiceFailures:
                     files=_tex_upload(),
                 )
         assert resp.status_code == 500
-        assert "analysis" in resp.json()["detail"].lower()
+        assert "analysis" in _json(resp)["detail"].lower()
 
     async def test_extraction_failure_returns_500(self):
         patches = _patch_all()
@@ -277,7 +274,7 @@ class TestEndpointServiceFailures:
                     files=_tex_upload(),
                 )
         assert resp.status_code == 500
-        assert "extraction" in resp.json()["detail"].lower()
+        assert "extraction" in _json(resp)["detail"].lower()
 
     async def test_match_failure_returns_500(self):
         patches = _patch_all()
@@ -294,7 +291,7 @@ class TestEndpointServiceFailures:
                     files=_tex_upload(),
                 )
         assert resp.status_code == 500
-        assert "matching" in resp.json()["detail"].lower()
+        assert "matching" in _json(resp)["detail"].lower()
 
     async def test_compile_failure_still_returns_200(self):
         """PDF compilation failure is non-fatal — endpoint returns data without PDF."""
@@ -312,7 +309,7 @@ class TestEndpointServiceFailures:
                     files=_tex_upload(),
                 )
         assert resp.status_code == 200
-        body = resp.json()
+        body = _json(resp)
         assert body["pdf_url"] == ""
         assert body["pdf_b64"] == ""
 
@@ -331,4 +328,4 @@ class TestEndpointServiceFailures:
                     files=_tex_upload(),
                 )
         assert resp.status_code == 500
-        assert "latex" in resp.json()["detail"].lower()
+        assert "latex" in _json(resp)["detail"].lower()
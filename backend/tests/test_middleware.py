@@ -1,10 +1,5 @@
 """Tests for request ID middleware and global exception handlers."""
 
-import os
-import sys
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import pytest
 from fastapi.testclient import TestClient
 
@@ -1,13 +1,9 @@
 """Comprehensive tests for app.latex.parser module."""
 
-import os
-import sys
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import pytest
 
 from app.latex.parser import (
+    _extract_marked_sections,
     _parse_sub_blocks,
     extract_between_markers,
     get_skills_on_resume,
@@ -147,6 +143,13 @@ class TestExtractBetweenMarkers:
         result = extract_between_markers(tex, "% START", "% END")
         assert "content here" in result
 
+    def test_blank_lines_after_start_are_skipped(self):
+        """Content begins at the first non-blank line, same as the section parser."""
+        tex = "% SUMMARY_START\n\n  \nBody line\n% SUMMARY_END\n"
+        result = extract_between_markers(tex, "% SUMMARY_START", "% SUMMARY_END")
+        assert result == "Body line\n"
+        assert _extract_marked_sections(tex) == {"SUMMARY": result}
+
 
 # ===================================================================
 # Tests for _parse_sub_blocks
@@ -278,6 +281,24 @@ class TestParseResumeSections:
         assert sections["experience"] == {}
         assert sections["projects"] == {}
 
+    def test_repeat_parse_served_from_cache(self):
+        """Parsing the same .tex twice hits the cache and returns equal sections."""
+        from app.latex.parser import _sections_cache
+        first = parse_resume_sections(SAMPLE_TEX)
+        assert len(_sections_cache) == 1
+        second = parse_resume_sections(SAMPLE_TEX)
+        assert len(_sections_cache) == 1
+        assert second == first
+
+    def test_cached_result_not_shared_with_callers(self):
+        """Mutating a returned result must not leak into later parses."""
+        first = parse_resume_sections(SAMPLE_TEX)
+        first["skills"].pop("languages")
+        first["projects"].clear()
+        second = parse_resume_sections(SAMPLE_TEX)
+        assert "languages" in second["skills"]
+        assert "resume_tailor" in second["projects"]
+
     def test_empty_tex_gives_empty_everything(self):
         """An empty string produces empty summary and empty sub-dicts."""
         sections = parse_resume_sections("")
@@ -371,6 +392,15 @@ class TestGetSkillsOnResume:
         skills = get_skills_on_resume(sections)
         assert skills["langs"] == ["Python", "Rust", "Go"]
 
+    def test_repeat_lookup_served_from_cache(self, full_sections):
+        """Same skills content is parsed once; callers get independent lists."""
+        from app.latex.parser import _skills_cache
+        first = get_skills_on_resume(full_sections)
+        first["languages"].append("COBOL")
+        second = get_skills_on_resume(parse_resume_sections(SAMPLE_TEX))
+        assert len(_skills_cache) == 1
+        assert second["languages"] == ["Python", "JavaScript", "TypeScript", "Go"]
+
     def test_skillline_empty_braces(self):
         """A skillline with empty braces yields an empty list."""
         sections = {
@@ -8,75 +8,106 @@ Covers:
 - edge cases: empty sections, no matches, missing keys
 """
 
-import os
-import sys
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
 
 from app.models import ExtractedKeywords, MatchResult, ReorderPlan
 from app.services.reorderer import CATEGORY_ROLE_MAP, compute_reorder_plan
 
 
+pytestmark = pytest.mark.xdist_group("reorderer")
+
+
 # ---------------------------------------------------------------------------
 # Helpers — factory functions for building model instances with sane defaults
 # ---------------------------------------------------------------------------
 
+_DEFAULT_EXTRACTED = ExtractedKeywords(
+    languages=["Python", "Java"],
+    backend=["Django", "FastAPI"],
+    frontend=["React"],
+    ai_llm=["LangChain"],
+    databases=["PostgreSQL"],
+    devops=["Docker"],
+    soft_skills=[],
+    domains=[],
+    role_title="",
+    experience_level="mid",
+)
+
+_DEFAULT_MATCH = MatchResult(
+    matched={"backend": ["Django", "FastAPI"], "languages": ["Python"]},
+    missing_from_resume={"frontend": ["React"]},
+    injectable={"databases": ["PostgreSQL"]},
+    total_jd_keywords=10,
+    total_matched=3,
+    match_score=30,
+    dominant_category="backend",
+)
+
+_DEFAULT_SECTIONS = {
+    "skills": {
+        "backend": ["Django", "FastAPI", "Flask"],
+        "languages": ["Python", "Java", "Go"],
+        "frontend": ["React", "Vue"],
+        "databases": ["PostgreSQL", "Redis"],
+    },
+    "projects": {
+        "ChatBot": "Built a chatbot using Django and LangChain with Python.",
+        "Portfolio": "Personal portfolio site built with React and Vue.",
+        "DataPipeline": "ETL pipeline using PostgreSQL and Docker.",
+    },
+    "experience": {
+        "Acme Corp": "Developed Django and FastAPI microservices in Python.",
+        "Beta Inc": "Built React dashboards and maintained PostgreSQL databases.",
+    },
+}
+
+# Expected key sets, built once.
+_DEFAULT_SKILL_CATEGORIES = frozenset(_DEFAULT_SECTIONS["skills"])
+_EXPECTED_ROLE_MAP_KEYS = frozenset(
+    {"ai_llm", "backend", "frontend", "languages", "databases", "devops", "domains"}
+)
+
+
 def _extracted(**overrides) -> ExtractedKeywords:
-    """Build an ExtractedKeywords with optional field overrides."""
-    defaults = dict(
-        languages=["Python", "Java"],
-        backend=["Django", "FastAPI"],
-        frontend=["React"],
-        ai_llm=["LangChain"],
-        databases=["PostgreSQL"],
-        devops=["Docker"],
-        soft_skills=[],
-        domains=[],
-        role_title="",
-        experience_level="mid",
-    )
-    defaults.update(overrides)
-    return ExtractedKeywords(**defaults)
+    """Return the default ExtractedKeywords, or a copy with field overrides.
+
+    compute_reorder_plan only reads its inputs, so the default is shared.
+    """
+    if not overrides:
+        return _DEFAULT_EXTRACTED
+    return _DEFAULT_EXTRACTED.model_copy(update=overrides)
 
 
 def _match(**overrides) -> MatchResult:
-    """Build a MatchResult with optional field overrides."""
-    defaults = dict(
-        matched={"backend": ["Django", "FastAPI"], "languages": ["Python"]},
-        missing_from_resume={"frontend": ["React"]},
-        injectable={"databases": ["PostgreSQL"]},
-        total_jd_keywords=10,
-        total_matched=3,
-        match_score=30,
-        dominant_category="backend",
-    )
-    defaults.update(overrides)
-    return MatchResult(**defaults)
+    """Return the default MatchResult, or a copy with field overrides."""
+    if not overrides:
+        return _DEFAULT_MATCH
+    return _DEFAULT_MATCH.model_copy(update=overrides)
 
 
 def _sections(**overrides) -> dict:
     """Build a sections dict with optional key overrides."""
-    defaults = dict(
-        skills={
-            "backend": ["Django", "FastAPI", "Flask"],
-            "languages": ["Python", "Java", "Go"],
-            "frontend": ["React", "Vue"],
-            "databases": ["PostgreSQL", "Redis"],
-        },
-        projects={
-            "ChatBot": "Built a chatbot using Django and LangChain with Python.",
-            "Portfolio": "Personal portfolio site built with React and Vue.",
-            "DataPipeline": "ETL pipeline using PostgreSQL and Docker.",
-        },
-        experience={
-            "Acme Corp": "Developed Django and FastAPI microservices in Python.",
-            "Beta Inc": "Built React dashboards and maintained PostgreSQL databases.",
-        },
-    )
-    defaults.update(overrides)
-    return defaults
+    return {**_DEFAULT_SECTIONS, **overrides}
+
+
+def _skills(skills=None) -> dict:
+    """Sections with only skills populated (defaults to the standard set)."""
+    if skills is None:
+        skills = _DEFAULT_SECTIONS["skills"]
+    return {"skills": skills, "projects": {}, "experience": {}}
+
+
+def _projects(projects) -> dict:
+    """Sections with only projects populated."""
+    return {"skills": {}, "projects": projects, "experience": {}}
+
+
+def _experience(experience) -> dict:
+    """Sections with only experience populated."""
+    return {"skills": {}, "projects": {}, "experience": experience}
 
 
 # ===========================================================================
@@ -94,7 +125,7 @@ class TestSkillsCategoryOrder:
             "frontend": ["React", "Vue"],                 # 2
             "databases": [],                              # 0
         })
-        sections = _sections()
+        sections = _skills()
         plan = compute_reorder_plan(_extracted(), match, sections)
 
         assert plan.skills_category_order == ["backend", "frontend", "languages", "databases"]
@@ -107,11 +138,11 @@ class TestSkillsCategoryOrder:
             "frontend": ["React"],
             "databases": ["PostgreSQL"],
         })
-        sections = _sections()
+        sections = _skills()
         plan = compute_reorder_plan(_extracted(), match, sections)
 
         # All four categories must be present regardless of tie order
-        assert set(plan.skills_category_order) == {"backend", "languages", "frontend", "databases"}
+        assert frozenset(plan.skills_category_order) == _DEFAULT_SKILL_CATEGORIES
         assert len(plan.skills_category_order) == 4
 
     def test_unmatched_categories_appear_last(self):
@@ -119,7 +150,7 @@ class TestSkillsCategoryOrder:
         match = _match(matched={
             "backend": ["Django"],
         })
-        sections = _sections(skills={
+        sections = _skills({
             "backend": ["Django"],
             "languages": ["Python"],
             "frontend": ["React"],
@@ -137,7 +168,7 @@ class TestSkillsCategoryOrder:
             "backend": ["Django"],
             "ai_llm": ["LangChain"],  # ai_llm not in sections skills
         })
-        sections = _sections(skills={
+        sections = _skills({
             "backend": ["Django", "FastAPI"],
         })
         plan = compute_reorder_plan(_extracted(), match, sections)
@@ -148,7 +179,7 @@ class TestSkillsCategoryOrder:
     def test_single_category(self):
         """Works correctly when there is only one skills category."""
         match = _match(matched={"languages": ["Python", "Go"]})
-        sections = _sections(skills={"languages": ["Python", "Go", "Java"]})
+        sections = _skills({"languages": ["Python", "Go", "Java"]})
         plan = compute_reorder_plan(_extracted(), match, sections)
 
         assert plan.skills_category_order == ["languages"]
@@ -167,7 +198,7 @@ class TestProjectOrder:
             "backend": ["Django", "FastAPI"],
             "languages": ["Python"],
         })
-        sections = _sections(projects={
+        sections = _projects({
             "ProjectA": "Uses Django, FastAPI, and Python together.",   # 3 hits
             "ProjectB": "Uses Django only.",                            # 1 hit
             "ProjectC": "Uses Python and FastAPI for the API layer.",   # 2 hits
@@ -181,7 +212,7 @@ class TestProjectOrder:
     def test_case_insensitive_keyword_matching(self):
         """Keyword matching in project content should be case-insensitive."""
         match = _match(matched={"backend": ["Django"]})
-        sections = _sections(projects={
+        sections = _projects({
             "Upper": "Built with DJANGO framework.",
             "Lower": "Built with django framework.",
         })
@@ -193,7 +224,7 @@ class TestProjectOrder:
     def test_project_with_zero_overlap_still_included(self):
         """Projects that match no keywords should still be in the list."""
         match = _match(matched={"backend": ["Django"]})
-        sections = _sections(projects={
+        sections = _projects({
             "Relevant": "Built with Django.",
             "Unrelated": "No matching keywords here.",
         })
@@ -205,7 +236,7 @@ class TestProjectOrder:
     def test_no_projects_section(self):
         """When there are no projects at all, project_order is empty."""
         match = _match()
-        sections = _sections(projects={})
+        sections = _projects({})
         plan = compute_reorder_plan(_extracted(), match, sections)
 
         assert plan.project_order == []
@@ -217,7 +248,7 @@ class TestProjectOrder:
             "databases": ["PostgreSQL"],
             "devops": ["Docker"],
         })
-        sections = _sections(projects={
+        sections = _projects({
             "AllThree": "Django with PostgreSQL and Docker.",   # 3 hits
             "TwoHits": "Django and PostgreSQL setup.",          # 2 hits
             "OneHit": "Only Docker.",                           # 1 hit
@@ -226,6 +257,40 @@ class TestProjectOrder:
 
         assert plan.project_order == ["AllThree", "TwoHits", "OneHit"]
 
+    def test_order_by_distinct_keyword_hits(self):
+        """Mixed keyword sets: distinct hits decide the order, ties keep input order.
+
+        Hits: Mixed 4 (java, javascript, fastapi, postgresql), Full 4,
+        ChatBot 2, DataPipeline 2, Repeat 1 (repeats count once), None 0,
+        Portfolio 0.
+        """
+        match = _match(matched={
+            "backend": ["Django", "FastAPI"],
+            "languages": ["Python", "Java", "JavaScript"],
+            "databases": ["PostgreSQL"],
+            "devops": ["Docker"],
+        })
+        projects = {
+            "Mixed": "JavaScript frontend over a FastAPI and PostgreSQL backend.",
+            "Repeat": "Django, Django, and more Django.",
+            "Full": "Python Django service with PostgreSQL, shipped in Docker.",
+            "None": "A static site with no matched tooling.",
+            **_DEFAULT_SECTIONS["projects"],
+        }
+        plan = compute_reorder_plan(_extracted(), match, _projects(projects))
+
+        assert plan.project_order == [
+            "Mixed", "Full", "ChatBot", "DataPipeline", "Repeat", "None", "Portfolio",
+        ]
+
+    def test_prefix_sharing_keywords_each_count(self):
+        """Java and JavaScript both count toward a project that mentions JavaScript."""
+        match = _match(matched={"languages": ["Java", "JavaScript"], "backend": ["Django"]})
+        projects = {"A": "Django app", "B": "JavaScript SPA"}
+        plan = compute_reorder_plan(_extracted(), match, _projects(projects))
+
+        assert plan.project_order == ["B", "A"]
+
 
 # ===========================================================================
 # 3. summary_first_line — role_title with/without fallback
@@ -238,7 +303,7 @@ class TestSummaryFirstLine:
         """When extracted.role_title is set, it appears in the summary line."""
         extracted = _extracted(role_title="Senior Backend Engineer")
         match = _match(matched={"backend": ["Django", "FastAPI"]})
-        sections = _sections()
+        sections = _skills()
         plan = compute_reorder_plan(extracted, match, sections)
 
         assert plan.summary_first_line.startswith("Senior Backend Engineer")
@@ -250,7 +315,7 @@ class TestSummaryFirstLine:
             dominant_category="ai_llm",
             matched={"ai_llm": ["LangChain", "OpenAI"]},
         )
-        sections = _sections(skills={"ai_llm": ["LangChain", "OpenAI"]})
+        sections = _skills({"ai_llm": ["LangChain", "OpenAI"]})
         plan = compute_reorder_plan(extracted, match, sections)
 
         assert "AI/LLM Engineer" in plan.summary_first_line
@@ -262,7 +327,7 @@ class TestSummaryFirstLine:
             dominant_category="soft_skills",  # not in CATEGORY_ROLE_MAP
             matched={"soft_skills": ["leadership"]},
         )
-        sections = _sections(skills={"soft_skills": ["leadership"]})
+        sections = _skills({"soft_skills": ["leadership"]})
         plan = compute_reorder_plan(extracted, match, sections)
 
         assert "Software Developer" in plan.summary_first_line
@@ -274,7 +339,7 @@ class TestSummaryFirstLine:
             "backend": ["Django", "FastAPI"],
             "languages": ["Python"],
         })
-        sections = _sections()
+        sections = _skills()
         plan = compute_reorder_plan(extracted, match, sections)
 
         assert "Django" in plan.summary_first_line
@@ -284,7 +349,7 @@ class TestSummaryFirstLine:
         """When there are no matched skills, summary is just 'RoleTitle.'."""
         extracted = _extracted(role_title="Data Engineer")
         match = _match(matched={})
-        sections = _sections(skills={})
+        sections = _skills({})
         plan = compute_reorder_plan(extracted, match, sections)
 
         assert plan.summary_first_line == "Data Engineer."
@@ -297,7 +362,7 @@ class TestSummaryFirstLine:
             "languages": ["Python", "Go"],
             "databases": ["PostgreSQL", "Redis"],
         })
-        sections = _sections(skills={
+        sections = _skills({
             "backend": ["Django", "FastAPI"],
             "languages": ["Python", "Go"],
             "databases": ["PostgreSQL", "Redis"],
@@ -308,26 +373,26 @@ class TestSummaryFirstLine:
         # Count the items between "in " and the final "."
         assert plan.summary_first_line.count(",") <= 2  # at most 3 items => at most 2 commas
 
-    @pytest.mark.parametrize("dominant,expected_role", [
-        ("ai_llm", "AI/LLM Engineer"),
-        ("backend", "Backend Developer"),
-        ("frontend", "Frontend Developer"),
-        ("languages", "Software Developer"),
-        ("databases", "Software Developer"),
-        ("devops", "DevOps Engineer"),
-        ("domains", "Software Developer"),
-    ])
-    def test_category_role_map_values(self, dominant, expected_role):
+    def test_category_role_map_values(self):
         """Each dominant_category maps to the correct fallback role title."""
         extracted = _extracted(role_title="")
-        match = _match(
-            dominant_category=dominant,
-            matched={dominant: ["SomeSkill"]},
-        )
-        sections = _sections(skills={dominant: ["SomeSkill"]})
-        plan = compute_reorder_plan(extracted, match, sections)
-
-        assert expected_role in plan.summary_first_line
+        for dominant, expected_role in [
+            ("ai_llm", "AI/LLM Engineer"),
+            ("backend", "Backend Developer"),
+            ("frontend", "Frontend Developer"),
+            ("languages", "Software Developer"),
+            ("databases", "Software Developer"),
+            ("devops", "DevOps Engineer"),
+            ("domains", "Software Developer"),
+        ]:
+            match = _match(
+                dominant_category=dominant,
+                matched={dominant: ["SomeSkill"]},
+            )
+            sections = _skills({dominant: ["SomeSkill"]})
+            plan = compute_reorder_plan(extracted, match, sections)
+
+            assert expected_role in plan.summary_first_line, dominant
 
 
 # ===========================================================================
@@ -343,7 +408,7 @@ class TestExperienceEmphasis:
             "backend": ["Django", "FastAPI"],
             "languages": ["Python"],
         })
-        sections = _sections(experience={
+        sections = _experience({
             "Acme Corp": "Built microservices with Django and Python.",
         })
         plan = compute_reorder_plan(_extracted(), match, sections)
@@ -357,7 +422,7 @@ class TestExperienceEmphasis:
         match = _match(matched={
             "backend": ["Django", "FastAPI"],
         })
-        sections = _sections(experience={
+        sections = _experience({
             "Beta Inc": "Worked on React front-end applications.",
         })
         plan = compute_reorder_plan(_extracted(), match, sections)
@@ -369,7 +434,7 @@ class TestExperienceEmphasis:
     def test_experience_emphasis_case_insensitive(self):
         """Keyword matching in experience content is case-insensitive."""
         match = _match(matched={"backend": ["Django"]})
-        sections = _sections(experience={
+        sections = _experience({
             "Job": "Used DJANGO for the backend.",
         })
         plan = compute_reorder_plan(_extracted(), match, sections)
@@ -383,7 +448,7 @@ class TestExperienceEmphasis:
             "languages": ["Python", "Go", "Rust"],
             "databases": ["PostgreSQL", "Redis"],
         })
-        sections = _sections(experience={
+        sections = _experience({
             "MegaCorp": (
                 "Built systems with Django, FastAPI, Flask, Python, Go, Rust, "
                 "PostgreSQL, and Redis."
@@ -399,7 +464,7 @@ class TestExperienceEmphasis:
             "backend": ["Django"],
             "databases": ["PostgreSQL"],
         })
-        sections = _sections(experience={
+        sections = _experience({
             "Company A": "Django web application.",
             "Company B": "PostgreSQL data warehouse.",
             "Company C": "No relevant keywords.",
@@ -502,15 +567,60 @@ class TestEdgeCases:
 
 
 # ===========================================================================
-# 6. CATEGORY_ROLE_MAP integrity
+# 6. Property-based invariants
+# ===========================================================================
+
+_CATEGORIES = st.sampled_from(sorted(_EXPECTED_ROLE_MAP_KEYS | {"soft_skills"}))
+_KEYWORDS = st.text(alphabet="abcdefgh", min_size=1, max_size=5)
+_CONTENT = st.lists(_KEYWORDS, max_size=12).map(" ".join)
+_NAMES = st.text(alphabet="ABCDEFGH", min_size=1, max_size=4)
+
+
+class TestPlanInvariants:
+    """Bounds that must hold for any generated input."""
+
+    @settings(max_examples=25, deadline=None)
+    @given(
+        matched=st.dictionaries(_CATEGORIES, st.lists(_KEYWORDS, max_size=6)),
+        skills=st.dictionaries(_CATEGORIES, st.lists(_KEYWORDS, max_size=3)),
+        projects=st.dictionaries(_NAMES, _CONTENT, max_size=5),
+        experience=st.dictionaries(_NAMES, _CONTENT, max_size=5),
+    )
+    def test_plan_bounds(self, matched, skills, projects, experience):
+        match = _match(matched=matched)
+        sections = {"skills": skills, "projects": projects, "experience": experience}
+        plan = compute_reorder_plan(_extracted(), match, sections)
+
+        # Orders are permutations of the section keys
+        assert sorted(plan.skills_category_order) == sorted(skills)
+        assert sorted(plan.project_order) == sorted(projects)
+
+        # Skills categories never increase in match count
+        counts = [len(matched.get(cat, [])) for cat in plan.skills_category_order]
+        assert counts == sorted(counts, reverse=True)
+
+        # At most 3 skills mentioned => at most 2 commas
+        assert plan.summary_first_line.count(",") <= 2
+
+        # Emphasis: capped at five, each a matched keyword present in content
+        all_keywords = {kw.lower() for kws in matched.values() for kw in kws}
+        assert plan.experience_emphasis.keys() == experience.keys()
+        for name, emphasized in plan.experience_emphasis.items():
+            assert len(emphasized) <= 5
+            for kw in emphasized:
+                assert kw in all_keywords
+                assert kw in experience[name].lower()
+
+
+# ===========================================================================
+# 7. CATEGORY_ROLE_MAP integrity
 # ===========================================================================
 
 class TestCategoryRoleMap:
     """Validate the CATEGORY_ROLE_MAP constant itself."""
 
     def test_map_contains_expected_keys(self):
-        expected_keys = {"ai_llm", "backend", "frontend", "languages", "databases", "devops", "domains"}
-        assert set(CATEGORY_ROLE_MAP.keys()) == expected_keys
+        assert frozenset(CATEGORY_ROLE_MAP) == _EXPECTED_ROLE_MAP_KEYS
 
     def test_all_values_are_non_empty_strings(self):
         for key, value in CATEGORY_ROLE_MAP.items():
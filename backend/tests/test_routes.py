@@ -9,29 +9,12 @@ All validation tests hit guards before any pipeline/LLM calls, so they
 run quickly and require no mocks.
 """
 
-import os
-import sys
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import pytest
-from httpx import ASGITransport, AsyncClient
 
-from app.main import app
 from app.core.constants import MAX_UPLOAD_SIZE, MIN_TEX_SIZE
 
 
-# ---------------------------------------------------------------------------
-# Fixtures
-# ---------------------------------------------------------------------------
-
-
-@pytest.fixture
-async def client():
-    """Async httpx test client wired to the FastAPI app via ASGI transport."""
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
+pytestmark = pytest.mark.xdist_group("routes")
 
 
 # ---------------------------------------------------------------------------
@@ -54,12 +37,13 @@ VALID_TEX_BODY = (
     r"\end{document}" "\n"
 )
 
-assert len(VALID_JD) >= 50
-assert len(VALID_TEX_BODY) >= MIN_TEX_SIZE
+# Fixed upload payloads, encoded once.
+_VALID_TEX_BYTES = VALID_TEX_BODY.encode()
+_BAD_UTF8 = b"\xc3\x28" * 100  # invalid UTF-8, > MIN_TEX_SIZE bytes
 
 
 def _tex_file(
-    content=VALID_TEX_BODY,
+    content=_VALID_TEX_BYTES,
     filename="resume.tex",
     content_type="application/x-tex",
 ):
@@ -69,6 +53,37 @@ def _tex_file(
     return {"resume_file": (filename, content, content_type)}
 
 
+def _oversized_upload(size, chunk_size=64 * 1024):
+    """Build ``(headers, content)`` streaming a .tex upload of ``size`` bytes.
+
+    The multipart body is yielded in fixed chunks of one reused block, so
+    the oversized payload never exists as a single bytes object client-side.
+    """
+    boundary = "resume-tailor-test-boundary"
+    head = (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="jd_text"\r\n\r\n'
+        f"{VALID_JD}\r\n"
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="resume_file"; filename="resume.tex"\r\n'
+        "Content-Type: application/x-tex\r\n\r\n"
+    ).encode()
+    tail = f"\r\n--{boundary}--\r\n".encode()
+    block = b"x" * chunk_size
+
+    def body():
+        yield head
+        remaining = size
+        while remaining > 0:
+            n = min(chunk_size, remaining)
+            yield block if n == chunk_size else block[:n]
+            remaining -= n
+        yield tail
+
+    headers = {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+    return headers, body()
+
+
 def _form(jd_text=VALID_JD, **extra):
     """Build the ``data`` dict for the /api/tailor form fields."""
     payload = {"jd_text": jd_text}
@@ -76,12 +91,18 @@ def _form(jd_text=VALID_JD, **extra):
     return payload
 
 
+def test_fixture_constants_within_bounds():
+    """VALID_JD / VALID_TEX_BODY must clear the endpoint's size guards."""
+    assert len(VALID_JD) >= 50
+    assert len(VALID_TEX_BODY) >= MIN_TEX_SIZE
+
+
 # ============================================================================
 # 1. Health endpoint
 # ============================================================================
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 class TestHealthEndpoint:
     """GET /api/health — basic liveness/readiness checks."""
 
@@ -104,7 +125,6 @@ class TestHealthEndpoint:
 # ============================================================================
 
 
-@pytest.mark.asyncio
 class TestTailorValidation:
     """POST /api/tailor validation guards.
 
@@ -112,31 +132,31 @@ class TestTailorValidation:
     so no mocks or network access are needed and execution is fast.
     """
 
-    async def test_missing_resume_file_returns_422(self, client):
+    def test_missing_resume_file_returns_422(self, sync_client):
         """Omitting resume_file entirely must yield 422."""
-        response = await client.post("/api/tailor", data=_form())
+        response = sync_client.post("/api/tailor", data=_form())
         assert response.status_code == 422
 
-    async def test_missing_jd_text_returns_422(self, client):
+    def test_missing_jd_text_returns_422(self, sync_client):
         """Omitting jd_text (required Form field) must yield 422."""
-        response = await client.post("/api/tailor", files=_tex_file())
+        response = sync_client.post("/api/tailor", files=_tex_file())
         assert response.status_code == 422
 
-    async def test_jd_text_too_short_returns_422(self, client):
+    def test_jd_text_too_short_returns_422(self, sync_client):
         """JD text shorter than 50 characters must be rejected (422)."""
         short_jd = "This JD is way too short."
         assert len(short_jd) < 50
 
-        response = await client.post(
+        response = sync_client.post(
             "/api/tailor",
             data=_form(jd_text=short_jd),
             files=_tex_file(),
         )
         assert response.status_code == 422
 
-    async def test_wrong_file_extension_returns_400(self, client):
+    def test_wrong_file_extension_returns_400(self, sync_client):
         """Uploading a .pdf instead of .tex must be rejected with 400."""
-        response = await client.post(
+        response = sync_client.post(
             "/api/tailor",
             data=_form(),
             files=_tex_file(filename="resume.pdf"),
@@ -144,9 +164,9 @@ class TestTailorValidation:
         assert response.status_code == 400
         assert "tex" in response.json()["detail"].lower()
 
-    async def test_invalid_content_type_returns_400(self, client):
+    def test_invalid_content_type_returns_400(self, sync_client):
         """An image/png content type on a .tex file must be rejected with 400."""
-        response = await client.post(
+        response = sync_client.post(
             "/api/tailor",
             data=_form(),
             files=_tex_file(content_type="image/png"),
@@ -155,35 +175,30 @@ class TestTailorValidation:
         detail = response.json()["detail"].lower()
         assert "file type" in detail or "tex" in detail
 
-    async def test_file_too_large_returns_413(self, client):
+    def test_file_too_large_returns_413(self, sync_client):
         """A file exceeding MAX_UPLOAD_SIZE (2 MB) must be rejected with 413."""
-        oversized = b"%" + b"x" * (MAX_UPLOAD_SIZE + 1)
-        response = await client.post(
-            "/api/tailor",
-            data=_form(),
-            files=_tex_file(content=oversized),
-        )
+        headers, content = _oversized_upload(MAX_UPLOAD_SIZE + 1)
+        response = sync_client.post("/api/tailor", headers=headers, content=content)
         assert response.status_code == 413
         assert "large" in response.json()["detail"].lower()
 
-    async def test_non_utf8_file_returns_400(self, client):
+    def test_non_utf8_file_returns_400(self, sync_client):
         """A .tex file with invalid UTF-8 bytes must be rejected with 400."""
-        bad_bytes = b"\xc3\x28" * 100  # invalid UTF-8, > MIN_TEX_SIZE bytes
-        response = await client.post(
+        response = sync_client.post(
             "/api/tailor",
             data=_form(),
-            files=_tex_file(content=bad_bytes),
+            files=_tex_file(content=_BAD_UTF8),
         )
         assert response.status_code == 400
         detail = response.json()["detail"].lower()
         assert "utf-8" in detail or "utf" in detail
 
-    async def test_file_too_small_returns_400(self, client):
+    def test_file_too_small_returns_400(self, sync_client):
         """A .tex file under MIN_TEX_SIZE chars must be rejected."""
         tiny_tex = r"\documentclass{article}" + "\n"
         assert 0 < len(tiny_tex) < MIN_TEX_SIZE
 
-        response = await client.post(
+        response = sync_client.post(
             "/api/tailor",
             data=_form(),
             files=_tex_file(content=tiny_tex),
@@ -197,7 +212,7 @@ class TestTailorValidation:
 # ============================================================================
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 class TestCORSHeaders:
     """Verify CORS middleware behaviour on preflight and normal responses."""
 
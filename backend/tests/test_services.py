@@ -4,123 +4,199 @@ All LLM calls are mocked — these verify input prep, output parsing,
 and error handling without making real API calls.
 """
 
-import os
-import sys
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from unittest.mock import AsyncMock, patch, MagicMock
+from types import MappingProxyType
+from unittest.mock import ANY
 
 import pytest
+from pydantic import ValidationError
 
+from app.core.constants import TEX_TRUNCATE_LENGTH
 from app.models import ExtractedKeywords, MatchResult, ResumeAnalysis
+from app.services import extractor, matcher, resume_analyzer
 from app.services.extractor import extract_keywords
 from app.services.matcher import match_keywords, _format_skills_dict
 from app.services.resume_analyzer import analyze_uploaded_resume
 from tests.conftest import SAMPLE_TEX
 
 
+# JD / .tex inputs, built once.
+_LONG_JD = "A long job description " * 10
+_SHORT_JD = "Some JD text " * 10
+_OVERLONG_TEX = "x" * (TEX_TRUNCATE_LENGTH + 1000)
+
+# Canned LLM responses, shared read-only across tests.
+_EXTRACT_RESP_HAPPY = MappingProxyType({
+    "languages": ["Python", "Go"],
+    "backend": ["Django", "FastAPI"],
+    "frontend": [],
+    "ai_llm": [],
+    "databases": ["PostgreSQL"],
+    "devops": ["Docker"],
+    "soft_skills": [],
+    "domains": [],
+    "role_title": "Backend Engineer",
+    "experience_level": "senior",
+})
+_EXTRACT_RESP_MINIMAL = MappingProxyType({
+    "languages": ["Python"], "backend": [], "frontend": [],
+    "ai_llm": [], "databases": [], "devops": [],
+    "soft_skills": [], "domains": [],
+    "role_title": "", "experience_level": "",
+})
+_EXTRACT_RESP_FALLBACK = MappingProxyType({
+    "languages": ["Python"],
+    "backend": ["Django"],
+    "frontend": [], "ai_llm": [], "databases": [],
+    "devops": [], "soft_skills": [], "domains": [],
+    "role_title": "Engineer", "experience_level": "senior",
+})
+
+_MATCH_RESP_HAPPY = MappingProxyType({
+    "matched": {"backend": ["Django", "FastAPI"], "languages": ["Python", "Go"]},
+    "missing_from_resume": {"devops": ["Docker"]},
+    "injectable": {"databases": ["PostgreSQL"]},
+})
+_MATCH_RESP_PYTHON_ONLY = MappingProxyType({
+    "matched": {"languages": ["Python"]},
+    "missing_from_resume": {},
+    "injectable": {},
+})
+_MATCH_RESP_FALLBACK = MappingProxyType({
+    "matched": {"languages": ["Python"], "backend": ["Django"]},
+    "missing_from_resume": {},
+    "injectable": {},
+})
+_MATCH_RESP_EMPTY = MappingProxyType({
+    "matched": {},
+    "missing_from_resume": {},
+    "injectable": {},
+})
+
+_ANALYZE_RESP_HAPPY = MappingProxyType({
+    "marked_tex": SAMPLE_TEX,
+    "skills": {
+        "languages": ["Python", "JavaScript"],
+        "backend": ["Django", "FastAPI"],
+    },
+    "sections_found": ["summary", "skills", "projects"],
+    "person_name": "Jane Doe",
+})
+_ANALYSIS_HAPPY = ResumeAnalysis.model_construct(**_ANALYZE_RESP_HAPPY)
+_ANALYZE_RESP_FALLBACK = MappingProxyType({
+    "marked_tex": SAMPLE_TEX,
+    "skills": {"languages": ["Python"]},
+    "sections_found": ["skills"],
+    "person_name": "Jane",
+})
+_ANALYZE_RESP_MINIMAL = MappingProxyType({
+    "marked_tex": "tex",
+    "skills": {},
+    "sections_found": [],
+    "person_name": "",
+})
+
+
+# Read-only inputs shared across tests — built once, validation skipped.
+_EXTRACTED = ExtractedKeywords.model_construct(
+    languages=["Python", "Go"],
+    backend=["Django", "FastAPI"],
+    databases=["PostgreSQL"],
+    devops=["Docker"],
+)
+_EMPTY_EXTRACTED = ExtractedKeywords.model_construct()
+
+_MASTER_SKILLS = {
+    "languages": ["Python", "JavaScript", "Go"],
+    "backend": ["Django", "FastAPI", "Flask"],
+    "databases": ["PostgreSQL", "Redis"],
+}
+
+_SKILLS_ON_RESUME = {
+    "languages": ["Python", "JavaScript"],
+    "backend": ["Django", "Flask"],
+}
+
+
+def _patch_llm(monkeypatch, module, llm, prompt=("sys", "usr", None)):
+    """Point ``module``'s LLM client at ``llm`` and stub its prompt lookup.
+
+    ``module`` is the imported service module itself, so no dotted-path
+    resolution happens per test.
+
+    Returns the list of positional args each prompt lookup was called with.
+    """
+    prompt_calls = []
+
+    async def _get_llm_client():
+        return llm
+
+    def _get_prompt_messages(*args, **kwargs):
+        prompt_calls.append(args)
+        return prompt
+
+    monkeypatch.setattr(module, "get_llm_client", _get_llm_client)
+    monkeypatch.setattr(module, "get_prompt_messages", _get_prompt_messages)
+    return prompt_calls
+
+
 # ===========================================================================
 # extract_keywords (Step 1)
 # ===========================================================================
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 class TestExtractKeywords:
     """Tests for the JD keyword extraction service."""
 
-    async def test_returns_extracted_keywords_on_success(self):
+    async def test_returns_extracted_keywords_on_success(self, mock_llm, monkeypatch):
         """Happy path: LLM returns valid JSON, parsed into ExtractedKeywords."""
-        llm_response = {
-            "languages": ["Python", "Go"],
-            "backend": ["Django", "FastAPI"],
-            "frontend": [],
-            "ai_llm": [],
-            "databases": ["PostgreSQL"],
-            "devops": ["Docker"],
-            "soft_skills": [],
-            "domains": [],
-            "role_title": "Backend Engineer",
-            "experience_level": "senior",
-        }
-
-        mock_llm = AsyncMock()
-        mock_llm.call_json = AsyncMock(return_value=llm_response)
+        mock_llm.call_json.return_value = _EXTRACT_RESP_HAPPY
 
-        with patch("app.services.extractor.get_llm_client", return_value=mock_llm), \
-             patch("app.services.extractor.get_prompt_messages", return_value=(
-                 "system prompt", "user prompt", {"temperature": 0.1}
-             )):
-            result = await extract_keywords("A long job description " * 10, "Backend Engineer")
+        _patch_llm(
+            monkeypatch, extractor, mock_llm,
+            prompt=("system prompt", "user prompt", {"temperature": 0.1}),
+        )
+        result = await extract_keywords(_LONG_JD, "Backend Engineer")
 
         assert isinstance(result, ExtractedKeywords)
         assert result.languages == ["Python", "Go"]
         assert result.backend == ["Django", "FastAPI"]
         assert result.role_title == "Backend Engineer"
 
-    async def test_uses_fallback_when_langfuse_fails(self):
+    async def test_uses_fallback_when_langfuse_fails(self, mock_llm, monkeypatch):
         """When Langfuse prompt fetch fails, fallback prompts are used and LLM is called."""
-        mock_llm = AsyncMock()
-        mock_llm.call_json = AsyncMock(return_value={
-            "languages": ["Python"], "backend": [], "frontend": [],
-            "ai_llm": [], "databases": [], "devops": [],
-            "soft_skills": [], "domains": [],
-            "role_title": "", "experience_level": "",
-        })
-        with patch("app.services.extractor.get_llm_client", return_value=mock_llm), \
-             patch("app.services.extractor.get_prompt_messages", return_value=None):
-            result = await extract_keywords("Some JD text " * 10)
+        mock_llm.call_json.return_value = _EXTRACT_RESP_MINIMAL
+        _patch_llm(monkeypatch, extractor, mock_llm, prompt=None)
+        result = await extract_keywords(_SHORT_JD)
         assert result is not None
         mock_llm.call_json.assert_called_once()
 
-    async def test_returns_none_when_llm_returns_none(self):
-        """When LLM call returns None, return None."""
-        mock_llm = AsyncMock()
-        mock_llm.call_json = AsyncMock(return_value=None)
-
-        with patch("app.services.extractor.get_llm_client", return_value=mock_llm), \
-             patch("app.services.extractor.get_prompt_messages", return_value=(
-                 "sys", "usr", None
-             )):
-            result = await extract_keywords("A long job description " * 10)
-        assert result is None
-
-    async def test_returns_none_on_invalid_llm_response(self):
-        """When LLM returns data that can't be parsed into the model, return None."""
-        mock_llm = AsyncMock()
-        # Missing required structure — will cause validation error
-        mock_llm.call_json = AsyncMock(return_value={"invalid_field": 42})
-
-        with patch("app.services.extractor.get_llm_client", return_value=mock_llm), \
-             patch("app.services.extractor.get_prompt_messages", return_value=(
-                 "sys", "usr", None
-             )):
-            # ExtractedKeywords allows all fields to be empty/default,
-            # so extra fields are just ignored by Pydantic v2.
-            result = await extract_keywords("A long job description " * 10)
-            # Pydantic v2 ignores extra fields, so this actually succeeds with defaults
-            assert result is not None or result is None  # either is acceptable
-
-    async def test_uses_default_config_when_langfuse_config_is_none(self):
+    async def test_uses_default_config_when_langfuse_config_is_none(self, mock_llm, monkeypatch):
         """When Langfuse returns None config, defaults are used."""
-        mock_llm = AsyncMock()
-        mock_llm.call_json = AsyncMock(return_value={
-            "languages": ["Python"],
-            "backend": [], "frontend": [], "ai_llm": [],
-            "databases": [], "devops": [], "soft_skills": [],
-            "domains": [], "role_title": "", "experience_level": "",
-        })
-
-        with patch("app.services.extractor.get_llm_client", return_value=mock_llm), \
-             patch("app.services.extractor.get_prompt_messages", return_value=(
-                 "sys", "usr", None  # config is None
-             )):
-            result = await extract_keywords("A long job description " * 10)
+        mock_llm.call_json.return_value = _EXTRACT_RESP_MINIMAL
+
+        _patch_llm(monkeypatch, extractor, mock_llm)  # config is None
+        result = await extract_keywords(_LONG_JD)
 
         # Verify call was made with defaults
-        call_kwargs = mock_llm.call_json.call_args
-        assert call_kwargs.kwargs["temperature"] == 0.1
-        assert call_kwargs.kwargs["max_tokens"] == 1000
+        mock_llm.call_json.assert_called_once_with(
+            prompt=ANY, system_prompt=ANY,
+            temperature=0.1, max_tokens=1000, name="jd-keyword-extraction",
+        )
+
+
+class TestExtractedKeywordsValidation:
+    """How ExtractedKeywords treats malformed LLM payloads (no LLM, no loop)."""
+
+    def test_unknown_fields_ignored(self):
+        """Extra keys are dropped and every field keeps its default."""
+        result = ExtractedKeywords.model_validate({"invalid_field": 42})
+        assert result == ExtractedKeywords()
+
+    def test_wrong_field_type_rejected(self):
+        """A non-list category fails validation (extract_keywords returns None)."""
+        with pytest.raises(ValidationError):
+            ExtractedKeywords.model_validate({"languages": 42})
 
 
 # ===========================================================================
@@ -128,48 +204,29 @@ class TestExtractKeywords:
 # ===========================================================================
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 class TestMatchKeywords:
     """Tests for the LLM-based skill matching service."""
 
-    @pytest.fixture()
+    @pytest.fixture(scope="module")
     def extracted(self):
-        return ExtractedKeywords(
-            languages=["Python", "Go"],
-            backend=["Django", "FastAPI"],
-            databases=["PostgreSQL"],
-            devops=["Docker"],
-        )
+        return _EXTRACTED
 
-    @pytest.fixture()
+    @pytest.fixture(scope="module")
     def master_skills(self):
-        return {
-            "languages": ["Python", "JavaScript", "Go"],
-            "backend": ["Django", "FastAPI", "Flask"],
-            "databases": ["PostgreSQL", "Redis"],
-        }
+        return _MASTER_SKILLS
 
-    @pytest.fixture()
+    @pytest.fixture(scope="module")
     def skills_on_resume(self):
-        return {
-            "languages": ["Python", "JavaScript"],
-            "backend": ["Django", "Flask"],
-        }
+        return _SKILLS_ON_RESUME
 
-    async def test_returns_match_result_on_success(self, extracted, master_skills, skills_on_resume):
-        llm_response = {
-            "matched": {"backend": ["Django", "FastAPI"], "languages": ["Python", "Go"]},
-            "missing_from_resume": {"devops": ["Docker"]},
-            "injectable": {"databases": ["PostgreSQL"]},
-        }
-        mock_llm = AsyncMock()
-        mock_llm.call_json = AsyncMock(return_value=llm_response)
+    async def test_returns_match_result_on_success(
+        self, mock_llm, monkeypatch, extracted, master_skills, skills_on_resume,
+    ):
+        mock_llm.call_json.return_value = _MATCH_RESP_HAPPY
 
-        with patch("app.services.matcher.get_llm_client", return_value=mock_llm), \
-             patch("app.services.matcher.get_prompt_messages", return_value=(
-                 "sys", "usr", None
-             )):
-            result = await match_keywords(extracted, master_skills, skills_on_resume)
+        _patch_llm(monkeypatch, matcher, mock_llm)
+        result = await match_keywords(extracted, master_skills, skills_on_resume)
 
         assert isinstance(result, MatchResult)
         assert result.total_matched == 4  # Django, FastAPI, Python, Go
@@ -177,32 +234,19 @@ class TestMatchKeywords:
         assert result.match_score == 66  # 4/6 * 100 = 66
         assert result.dominant_category in ("backend", "languages")
 
-    async def test_uses_fallback_when_langfuse_fails(self, extracted, master_skills):
+    async def test_uses_fallback_when_langfuse_fails(
+        self, mock_llm, monkeypatch, extracted, master_skills,
+    ):
         """When Langfuse fails, fallback prompts are used and LLM is called."""
-        mock_llm = AsyncMock()
-        mock_llm.call_json = AsyncMock(return_value={
-            "matched": {"languages": ["Python"]},
-            "missing_from_resume": {},
-            "injectable": {},
-        })
-        with patch("app.services.matcher.get_llm_client", return_value=mock_llm), \
-             patch("app.services.matcher.get_prompt_messages", return_value=None):
-            result = await match_keywords(extracted, master_skills)
+        mock_llm.call_json.return_value = _MATCH_RESP_PYTHON_ONLY
+        _patch_llm(monkeypatch, matcher, mock_llm, prompt=None)
+        result = await match_keywords(extracted, master_skills)
         assert result is not None
         mock_llm.call_json.assert_called_once()
 
-    async def test_returns_none_when_llm_returns_none(self, extracted, master_skills):
-        mock_llm = AsyncMock()
-        mock_llm.call_json = AsyncMock(return_value=None)
-
-        with patch("app.services.matcher.get_llm_client", return_value=mock_llm), \
-             patch("app.services.matcher.get_prompt_messages", return_value=(
-                 "sys", "usr", None
-             )):
-            result = await match_keywords(extracted, master_skills)
-        assert result is None
-
-    async def test_match_score_clamped_to_100(self, extracted, master_skills):
+    async def test_match_score_clamped_to_100(
+        self, mock_llm, monkeypatch, extracted, master_skills,
+    ):
         """If LLM returns more matched than total JD keywords, score caps at 100."""
         llm_response = {
             "matched": {
@@ -212,32 +256,19 @@ class TestMatchKeywords:
             "missing_from_resume": {},
             "injectable": {},
         }
-        mock_llm = AsyncMock()
-        mock_llm.call_json = AsyncMock(return_value=llm_response)
+        mock_llm.call_json.return_value = llm_response
 
-        with patch("app.services.matcher.get_llm_client", return_value=mock_llm), \
-             patch("app.services.matcher.get_prompt_messages", return_value=(
-                 "sys", "usr", None
-             )):
-            result = await match_keywords(extracted, master_skills)
+        _patch_llm(monkeypatch, matcher, mock_llm)
+        result = await match_keywords(extracted, master_skills)
 
         assert result.match_score <= 100
 
-    async def test_zero_jd_keywords_no_division_error(self):
+    async def test_zero_jd_keywords_no_division_error(self, mock_llm, monkeypatch):
         """Empty JD keywords should not cause ZeroDivisionError."""
-        extracted = ExtractedKeywords()  # all empty
-        mock_llm = AsyncMock()
-        mock_llm.call_json = AsyncMock(return_value={
-            "matched": {},
-            "missing_from_resume": {},
-            "injectable": {},
-        })
+        mock_llm.call_json.return_value = _MATCH_RESP_EMPTY
 
-        with patch("app.services.matcher.get_llm_client", return_value=mock_llm), \
-             patch("app.services.matcher.get_prompt_messages", return_value=(
-                 "sys", "usr", None
-             )):
-            result = await match_keywords(extracted, {})
+        _patch_llm(monkeypatch, matcher, mock_llm)
+        result = await match_keywords(_EMPTY_EXTRACTED, {})
 
         assert result is not None
         assert result.match_score == 0
@@ -251,28 +282,28 @@ class TestMatchKeywords:
 class TestFormatSkillsDict:
     """Tests for the matcher's skill formatting helper."""
 
-    def test_formats_non_empty_categories(self):
-        result = _format_skills_dict({
-            "languages": ["Python", "Go"],
-            "backend": ["Django"],
-        })
-        assert "languages: Python, Go" in result
-        assert "backend: Django" in result
-
-    def test_empty_categories_omitted(self):
-        result = _format_skills_dict({
-            "languages": ["Python"],
-            "frontend": [],
-        })
-        assert "frontend" not in result
-
-    def test_all_empty_returns_none_marker(self):
-        result = _format_skills_dict({"a": [], "b": []})
-        assert result == "  (none)"
-
-    def test_empty_dict_returns_none_marker(self):
-        result = _format_skills_dict({})
-        assert result == "  (none)"
+    @pytest.mark.parametrize("skills, included, excluded, exact", [
+        pytest.param(
+            {"languages": ["Python", "Go"], "backend": ["Django"]},
+            ["languages: Python, Go", "backend: Django"], [], None,
+            id="formats_non_empty_categories",
+        ),
+        pytest.param(
+            {"languages": ["Python"], "frontend": []},
+            [], ["frontend"], None,
+            id="empty_categories_omitted",
+        ),
+        pytest.param({"a": [], "b": []}, [], [], "  (none)", id="all_empty_returns_none_marker"),
+        pytest.param({}, [], [], "  (none)", id="empty_dict_returns_none_marker"),
+    ])
+    def test_format_skills_dict(self, skills, included, excluded, exact):
+        result = _format_skills_dict(skills)
+        for text in included:
+            assert text in result
+        for text in excluded:
+            assert text not in result
+        if exact is not None:
+            assert result == exact
 
 
 # ===========================================================================
@@ -280,187 +311,143 @@ class TestFormatSkillsDict:
 # ===========================================================================
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 class TestAnalyzeUploadedResume:
     """Tests for the resume analysis service."""
 
-    async def test_returns_analysis_on_success(self):
-        llm_response = {
-            "marked_tex": SAMPLE_TEX,
-            "skills": {
-                "languages": ["Python", "JavaScript"],
-                "backend": ["Django", "FastAPI"],
-            },
-            "sections_found": ["summary", "skills", "projects"],
-            "person_name": "Jane Doe",
-        }
-        mock_llm = AsyncMock()
-        mock_llm.call_json = AsyncMock(return_value=llm_response)
+    async def test_returns_analysis_on_success(self, mock_llm, monkeypatch):
+        mock_llm.call_json.return_value = _ANALYZE_RESP_HAPPY
 
-        with patch("app.services.resume_analyzer.get_llm_client", return_value=mock_llm), \
-             patch("app.services.resume_analyzer.get_prompt_messages", return_value=(
-                 "sys", "usr", None
-             )):
-            result = await analyze_uploaded_resume(SAMPLE_TEX)
+        _patch_llm(monkeypatch, resume_analyzer, mock_llm)
+        result = await analyze_uploaded_resume(SAMPLE_TEX)
 
         assert isinstance(result, ResumeAnalysis)
-        assert result.person_name == "Jane Doe"
-        assert "languages" in result.skills
-        assert result.marked_tex == SAMPLE_TEX
+        assert result == _ANALYSIS_HAPPY
 
-    async def test_uses_fallback_when_langfuse_fails(self):
+    async def test_uses_fallback_when_langfuse_fails(self, mock_llm, monkeypatch):
         """When Langfuse fails, fallback prompts are used and LLM is called."""
-        mock_llm = AsyncMock()
-        mock_llm.call_json = AsyncMock(return_value={
-            "marked_tex": SAMPLE_TEX,
-            "skills": {"languages": ["Python"]},
-            "sections_found": ["skills"],
-            "person_name": "Jane",
-        })
-        with patch("app.services.resume_analyzer.get_llm_client", return_value=mock_llm), \
-             patch("app.services.resume_analyzer.get_prompt_messages", return_value=None):
-            result = await analyze_uploaded_resume(SAMPLE_TEX)
+        mock_llm.call_json.return_value = _ANALYZE_RESP_FALLBACK
+        _patch_llm(monkeypatch, resume_analyzer, mock_llm, prompt=None)
+        result = await analyze_uploaded_resume(SAMPLE_TEX)
         assert result is not None
         mock_llm.call_json.assert_called_once()
 
-    async def test_returns_none_when_llm_returns_none(self):
-        mock_llm = AsyncMock()
-        mock_llm.call_json = AsyncMock(return_value=None)
-
-        with patch("app.services.resume_analyzer.get_llm_client", return_value=mock_llm), \
-             patch("app.services.resume_analyzer.get_prompt_messages", return_value=(
-                 "sys", "usr", None
-             )):
-            result = await analyze_uploaded_resume(SAMPLE_TEX)
-        assert result is None
-
-    async def test_returns_none_on_invalid_response(self):
+    async def test_returns_none_on_invalid_response(self, mock_llm, monkeypatch):
         """LLM returns data missing required 'marked_tex' field."""
-        mock_llm = AsyncMock()
-        mock_llm.call_json = AsyncMock(return_value={
+        mock_llm.call_json.return_value = {
             "skills": {"languages": ["Python"]},
             # missing 'marked_tex' — required field
-        })
+        }
 
-        with patch("app.services.resume_analyzer.get_llm_client", return_value=mock_llm), \
-             patch("app.services.resume_analyzer.get_prompt_messages", return_value=(
-                 "sys", "usr", None
-             )):
-            result = await analyze_uploaded_resume(SAMPLE_TEX)
+        _patch_llm(monkeypatch, resume_analyzer, mock_llm)
+        result = await analyze_uploaded_resume(SAMPLE_TEX)
         assert result is None
 
-    async def test_uses_default_config_when_none(self):
+    async def test_uses_default_config_when_none(self, mock_llm, monkeypatch):
         """When Langfuse config is None, default config is used."""
-        mock_llm = AsyncMock()
-        mock_llm.call_json = AsyncMock(return_value={
-            "marked_tex": "tex",
-            "skills": {},
-            "sections_found": [],
-            "person_name": "",
-        })
-
-        with patch("app.services.resume_analyzer.get_llm_client", return_value=mock_llm), \
-             patch("app.services.resume_analyzer.get_prompt_messages", return_value=(
-                 "sys", "usr", None
-             )):
-            await analyze_uploaded_resume(SAMPLE_TEX)
-
-        call_kwargs = mock_llm.call_json.call_args
-        assert call_kwargs.kwargs["temperature"] == 0.1
-        assert call_kwargs.kwargs["max_tokens"] == 8000
-
-    async def test_truncates_long_tex_content(self):
+        mock_llm.call_json.return_value = _ANALYZE_RESP_MINIMAL
+
+        _patch_llm(monkeypatch, resume_analyzer, mock_llm)
+        await analyze_uploaded_resume(SAMPLE_TEX)
+
+        mock_llm.call_json.assert_called_once_with(
+            prompt=ANY, system_prompt=ANY,
+            temperature=0.1, max_tokens=8000, name="resume-analysis",
+        )
+
+    async def test_truncates_long_tex_content(self, mock_llm, monkeypatch):
         """Content longer than TEX_TRUNCATE_LENGTH is truncated before sending to LLM."""
-        from app.core.constants import TEX_TRUNCATE_LENGTH
-        long_tex = "x" * (TEX_TRUNCATE_LENGTH + 1000)
-
-        mock_llm = AsyncMock()
-        mock_llm.call_json = AsyncMock(return_value={
-            "marked_tex": "tex",
-            "skills": {},
-            "sections_found": [],
-            "person_name": "",
-        })
-
-        with patch("app.services.resume_analyzer.get_llm_client", return_value=mock_llm), \
-             patch("app.services.resume_analyzer.get_prompt_messages", return_value=(
-                 "sys", "usr", None
-             )) as mock_prompt:
-            await analyze_uploaded_resume(long_tex)
+
+        mock_llm.call_json.return_value = _ANALYZE_RESP_MINIMAL
+
+        prompt_calls = _patch_llm(monkeypatch, resume_analyzer, mock_llm)
+        await analyze_uploaded_resume(_OVERLONG_TEX)
 
         # Verify the template_vars passed to get_prompt_messages had truncated content
-        call_args = mock_prompt.call_args
-        template_vars = call_args[0][1]  # second positional arg
+        template_vars = prompt_calls[0][1]  # second positional arg
         assert len(template_vars["tex_content"]) == TEX_TRUNCATE_LENGTH
 
 
 # ===========================================================================
-# Fallback prompt tests (when Langfuse is unavailable)
+# LLM returns None (all services)
 # ===========================================================================
 
 
-@pytest.mark.asyncio
-class TestFallbackPrompts:
-    """Verify services work using embedded fallback prompts when Langfuse is down."""
-
-    async def test_extractor_uses_fallback_when_langfuse_returns_none(self):
-        """extract_keywords should use fallback prompt and still call LLM."""
-        llm_response = {
-            "languages": ["Python"],
-            "backend": ["Django"],
-            "frontend": [], "ai_llm": [], "databases": [],
-            "devops": [], "soft_skills": [], "domains": [],
-            "role_title": "Engineer", "experience_level": "senior",
-        }
-        mock_llm = AsyncMock()
-        mock_llm.call_json = AsyncMock(return_value=llm_response)
-
-        with patch("app.services.extractor.get_llm_client", return_value=mock_llm), \
-             patch("app.services.extractor.get_prompt_messages", return_value=None):
-            result = await extract_keywords("A long job description " * 10, "Engineer")
-
-        assert isinstance(result, ExtractedKeywords)
-        assert result.languages == ["Python"]
-        mock_llm.call_json.assert_called_once()
-
-    async def test_analyzer_uses_fallback_when_langfuse_returns_none(self):
-        """analyze_uploaded_resume should use fallback prompt and still call LLM."""
-        llm_response = {
-            "marked_tex": SAMPLE_TEX,
-            "skills": {"languages": ["Python"]},
-            "sections_found": ["skills"],
-            "person_name": "Jane",
-        }
-        mock_llm = AsyncMock()
-        mock_llm.call_json = AsyncMock(return_value=llm_response)
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize("module, service_call", [
+    pytest.param(extractor, lambda: extract_keywords(_LONG_JD), id="extractor"),
+    pytest.param(
+        matcher,
+        lambda: match_keywords(_EXTRACTED, _MASTER_SKILLS),
+        id="matcher",
+    ),
+    pytest.param(
+        resume_analyzer,
+        lambda: analyze_uploaded_resume(SAMPLE_TEX),
+        id="analyzer",
+    ),
+])
+async def test_service_returns_none_when_llm_returns_none(
+    mock_llm, monkeypatch, module, service_call,
+):
+    """When the LLM call returns None, every service returns None."""
+    mock_llm.call_json.return_value = None
+
+    _patch_llm(monkeypatch, module, mock_llm)
+    assert await service_call() is None
 
-        with patch("app.services.resume_analyzer.get_llm_client", return_value=mock_llm), \
-             patch("app.services.resume_analyzer.get_prompt_messages", return_value=None):
-            result = await analyze_uploaded_resume(SAMPLE_TEX)
 
-        assert isinstance(result, ResumeAnalysis)
-        assert result.person_name == "Jane"
-        mock_llm.call_json.assert_called_once()
+# ===========================================================================
+# Fallback prompt tests (when Langfuse is unavailable)
+# ===========================================================================
 
-    async def test_matcher_uses_fallback_when_langfuse_returns_none(self):
-        """match_keywords should use fallback prompt and still call LLM."""
-        extracted = ExtractedKeywords(
-            languages=["Python"],
-            backend=["Django"],
-            databases=["PostgreSQL"],
-        )
-        llm_response = {
-            "matched": {"languages": ["Python"], "backend": ["Django"]},
-            "missing_from_resume": {},
-            "injectable": {},
-        }
-        mock_llm = AsyncMock()
-        mock_llm.call_json = AsyncMock(return_value=llm_response)
 
-        with patch("app.services.matcher.get_llm_client", return_value=mock_llm), \
-             patch("app.services.matcher.get_prompt_messages", return_value=None):
-            result = await match_keywords(extracted, {"languages": ["Python"]})
+@pytest.mark.asyncio(loop_scope="session")
+class TestFallbackPrompts:
+    """Verify services work using embedded fallback prompts when Langfuse is down."""
 
-        assert isinstance(result, MatchResult)
-        assert result.total_matched == 2
+    @pytest.mark.parametrize("module, service_call, llm_response, expected_type, check", [
+        pytest.param(
+            extractor,
+            lambda: extract_keywords(_LONG_JD, "Engineer"),
+            _EXTRACT_RESP_FALLBACK,
+            ExtractedKeywords,
+            lambda r: r.languages == ["Python"],
+            id="extractor",
+        ),
+        pytest.param(
+            resume_analyzer,
+            lambda: analyze_uploaded_resume(SAMPLE_TEX),
+            _ANALYZE_RESP_FALLBACK,
+            ResumeAnalysis,
+            lambda r: r.person_name == "Jane",
+            id="analyzer",
+        ),
+        pytest.param(
+            matcher,
+            lambda: match_keywords(
+                ExtractedKeywords(
+                    languages=["Python"],
+                    backend=["Django"],
+                    databases=["PostgreSQL"],
+                ),
+                {"languages": ["Python"]},
+            ),
+            _MATCH_RESP_FALLBACK,
+            MatchResult,
+            lambda r: r.total_matched == 2,
+            id="matcher",
+        ),
+    ])
+    async def test_uses_fallback_when_langfuse_returns_none(
+        self, mock_llm, monkeypatch, module, service_call, llm_response, expected_type, check,
+    ):
+        """Each service should use its fallback prompt and still call the LLM once."""
+        mock_llm.call_json.return_value = llm_response
+
+        _patch_llm(monkeypatch, module, mock_llm, prompt=None)
+        result = await service_call()
+
+        assert isinstance(result, expected_type)
+        assert check(result)
         mock_llm.call_json.assert_called_once()
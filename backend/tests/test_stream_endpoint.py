@@ -7,21 +7,18 @@ Reuses mock patterns from test_endpoint.py. Verifies that:
 - PDF compile failure is non-fatal (emits complete)
 """
 
-import json
-import os
-import sys
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from io import BytesIO
-from unittest.mock import AsyncMock, patch
+import re
 
+import httpx
+import orjson
 import pytest
-from httpx import ASGITransport, AsyncClient
+import pytest_asyncio
 
-from app.main import app
+from app.routes import tailor as tailor_route
 from app.models import ResumeAnalysis, ExtractedKeywords, MatchResult, ReorderPlan
-from tests.conftest import SAMPLE_TEX, SAMPLE_JD
+from tests.conftest import SAMPLE_TEX, SAMPLE_TEX_BYTES, SAMPLE_JD
+
+pytestmark = pytest.mark.xdist_group("stream")
 
 
 # ---------------------------------------------------------------------------
@@ -29,8 +26,9 @@ from tests.conftest import SAMPLE_TEX, SAMPLE_JD
 # ---------------------------------------------------------------------------
 
 
-def _tex_upload(content: str = SAMPLE_TEX, filename: str = "resume.tex") -> dict:
-    return {"resume_file": (filename, BytesIO(content.encode()), "application/x-tex")}
+def _tex_upload(content: str | None = None, filename: str = "resume.tex") -> dict:
+    body = SAMPLE_TEX_BYTES if content is None else content.encode()
+    return {"resume_file": (filename, body, "application/x-tex")}
 
 
 def _form_data(jd_text: str = SAMPLE_JD, **extra) -> dict:
@@ -39,6 +37,20 @@ def _form_data(jd_text: str = SAMPLE_JD, **extra) -> dict:
     return data
 
 
+def _encoded_default_upload() -> dict:
+    """``client.post`` kwargs carrying the default upload, encoded once."""
+    request = httpx.Request(
+        "POST", "http://test/api/tailor-stream", data=_form_data(), files=_tex_upload(),
+    )
+    return {
+        "content": request.read(),
+        "headers": {"content-type": request.headers["content-type"]},
+    }
+
+
+_DEFAULT_UPLOAD = _encoded_default_upload()
+
+
 MOCK_ANALYSIS = ResumeAnalysis(
     marked_tex=SAMPLE_TEX,
     skills={"languages": ["Python"], "backend": ["Django", "FastAPI"]},
@@ -71,108 +83,123 @@ MOCK_PLAN = ReorderPlan(
 )
 
 
-def _patch_all():
-    return {
-        "analyze": patch(
-            "app.routes.tailor.analyze_uploaded_resume",
-            new_callable=AsyncMock,
-            return_value=MOCK_ANALYSIS,
-        ),
-        "extract": patch(
-            "app.routes.tailor.extract_keywords",
-            new_callable=AsyncMock,
-            return_value=MOCK_EXTRACTED,
-        ),
-        "match": patch(
-            "app.routes.tailor.match_keywords",
-            new_callable=AsyncMock,
-            return_value=MOCK_MATCH,
-        ),
-        "reorder": patch(
-            "app.routes.tailor.compute_reorder_plan",
-            return_value=MOCK_PLAN,
-        ),
-        "inject": patch(
-            "app.routes.tailor.inject_into_latex",
-            return_value=(SAMPLE_TEX, "--- diff ---"),
-        ),
-        "compile": patch(
-            "app.routes.tailor.compile_pdf",
-            return_value=("Jane_Doe_Backend_abc123.pdf", b"%PDF-fake"),
-        ),
-        "flush": patch("app.routes.tailor.flush"),
-    }
+def _async_const(value):
+    """Async stand-in that ignores its arguments and returns ``value``."""
+    async def stub(*args, **kwargs):
+        return value
+    return stub
+
+
+def _raises(exc: Exception):
+    """Sync stand-in that raises ``exc`` whatever it is called with."""
+    def stub(*args, **kwargs):
+        raise exc
+    return stub
+
+
+# Attribute on app.routes.tailor -> stand-in for every pipeline stage.
+_STUBS = {
+    "analyze_uploaded_resume": _async_const(MOCK_ANALYSIS),
+    "extract_keywords": _async_const(MOCK_EXTRACTED),
+    "match_keywords": _async_const(MOCK_MATCH),
+    "compute_reorder_plan": lambda *args, **kwargs: MOCK_PLAN,
+    "inject_into_latex": lambda *args, **kwargs: (SAMPLE_TEX, "--- diff ---"),
+    "compile_pdf": lambda *args, **kwargs: ("Jane_Doe_Backend_abc123.pdf", b"%PDF-fake"),
+    "flush": lambda *args, **kwargs: None,
+}
+
+
+def _install_stubs(mp: pytest.MonkeyPatch) -> None:
+    for name, stub in _STUBS.items():
+        mp.setattr(tailor_route, name, stub)
+
+
+@pytest.fixture
+def stub_tailor(monkeypatch):
+    """Replace every pipeline stage on the tailor route with a plain stub.
+
+    Returns a setter that swaps one stage's stub by attribute name.
+    """
+    _install_stubs(monkeypatch)
+
+    def override(name: str, stub) -> None:
+        assert name in _STUBS, name
+        monkeypatch.setattr(tailor_route, name, stub)
+
+    return override
 
 
-def _parse_sse_events(raw_text: str) -> list[dict]:
-    """Parse SSE event text into a list of {event, data} dicts."""
-    events = []
-    for block in raw_text.split("\n\n"):
-        block = block.strip()
-        if not block:
-            continue
-        event_type = None
-        data_str = ""
-        for line in block.split("\n"):
-            if line.startswith("event: "):
-                event_type = line[7:].strip()
-            elif line.startswith("data: "):
-                data_str += line[6:]
-        if event_type and data_str:
-            events.append({"event": event_type, "data": json.loads(data_str)})
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def happy_events(client):
+    """Parsed events of one stubbed happy-path stream, shared by read-only tests."""
+    with pytest.MonkeyPatch.context() as mp:
+        _install_stubs(mp)
+        _, events = await _collect_events(client)
     return events
 
 
+# One SSE frame as emitted by _sse_event: a single event line, a single data line.
+_SSE_RE = re.compile(rb"^event: ([^\n]+)\ndata: ([^\n]+)$", re.MULTILINE)
+
+
+def _parse_sse_events(raw: bytes) -> list[dict]:
+    """Parse an SSE response body into a list of {event, data} dicts."""
+    return [
+        {"event": m[1].decode().strip(), "data": orjson.loads(m[2])}
+        for m in _SSE_RE.finditer(raw)
+    ]
+
+
+async def _collect_events(client):
+    """POST the default upload to the stream endpoint and parse every event.
+
+    Returns the (closed) response — for status and headers — and the events.
+    """
+    async with client.stream("POST", "/api/tailor-stream", **_DEFAULT_UPLOAD) as resp:
+        raw = b"".join([chunk async for chunk in resp.aiter_bytes()])
+    return resp, _parse_sse_events(raw)
+
+
 # ---------------------------------------------------------------------------
 # Tests — Validation (normal HTTP errors, not SSE)
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-class TestStreamValidation:
-    """Validation errors should return normal HTTP responses, not SSE streams."""
+class TestStreamFormValidation:
+    """Form-level rejections (422) — sync TestClient, no event loop needed."""
+
+    def test_missing_file_returns_422(self, sync_client):
+        resp = sync_client.post("/api/tailor-stream", data=_form_data())
+        assert resp.status_code == 422
 
-    async def test_missing_file_returns_422(self):
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.post("/api/tailor-stream", data=_form_data())
+    def test_empty_jd_returns_422(self, sync_client):
+        resp = sync_client.post(
+            "/api/tailor-stream",
+            data=_form_data(jd_text="too short"),
+            files=_tex_upload(),
+        )
         assert resp.status_code == 422
 
-    async def test_non_tex_file_returns_400(self):
-        patches = _patch_all()
-        with patches["analyze"], patches["extract"], patches["match"], \
-             patches["reorder"], patches["inject"], patches["compile"], patches["flush"]:
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-                resp = await client.post(
-                    "/api/tailor-stream",
-                    data=_form_data(),
-                    files=_tex_upload(filename="resume.pdf"),
-                )
+
+@pytest.mark.asyncio(loop_scope="module")
+class TestStreamValidation:
+    """Validation errors should return normal HTTP responses, not SSE streams."""
+
+    async def test_non_tex_file_returns_400(self, client, stub_tailor):
+        resp = await client.post(
+            "/api/tailor-stream",
+            data=_form_data(),
+            files=_tex_upload(filename="resume.pdf"),
+        )
         assert resp.status_code == 400
         assert "tex" in resp.json()["detail"].lower()
 
-    async def test_empty_jd_returns_422(self):
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.post(
-                "/api/tailor-stream",
-                data=_form_data(jd_text="too short"),
-                files=_tex_upload(),
-            )
-        assert resp.status_code == 422
-
-    async def test_tiny_tex_returns_400(self):
-        patches = _patch_all()
-        with patches["analyze"], patches["extract"], patches["match"], \
-             patches["reorder"], patches["inject"], patches["compile"], patches["flush"]:
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-                resp = await client.post(
-                    "/api/tailor-stream",
-                    data=_form_data(),
-                    files=_tex_upload(content="hi"),
-                )
+    async def test_tiny_tex_returns_400(self, client, stub_tailor):
+        resp = await client.post(
+            "/api/tailor-stream",
+            data=_form_data(),
+            files=_tex_upload(content="hi"),
+        )
         assert resp.status_code == 400
         assert "small" in resp.json()["detail"].lower()
 
@@ -182,52 +209,23 @@ class TestStreamValidation:
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 class TestStreamHappyPath:
 
-    async def test_stream_returns_200_event_stream(self):
-        patches = _patch_all()
-        with patches["analyze"], patches["extract"], patches["match"], \
-             patches["reorder"], patches["inject"], patches["compile"], patches["flush"]:
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-                resp = await client.post(
-                    "/api/tailor-stream",
-                    data=_form_data(),
-                    files=_tex_upload(),
-                )
+    async def test_stream_returns_200_event_stream(self, client, stub_tailor):
+        resp, _ = await _collect_events(client)
         assert resp.status_code == 200
         assert "text/event-stream" in resp.headers.get("content-type", "")
 
-    async def test_stream_emits_progress_events(self):
-        patches = _patch_all()
-        with patches["analyze"], patches["extract"], patches["match"], \
-             patches["reorder"], patches["inject"], patches["compile"], patches["flush"]:
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-                resp = await client.post(
-                    "/api/tailor-stream",
-                    data=_form_data(),
-                    files=_tex_upload(),
-                )
-        events = _parse_sse_events(resp.text)
+    async def test_stream_emits_progress_events(self, happy_events):
+        events = happy_events
         progress_events = [e for e in events if e["event"] == "progress"]
         assert len(progress_events) == 6
         steps = [e["data"]["step"] for e in progress_events]
         assert steps == [0, 1, 2, 3, 4, 5]
 
-    async def test_stream_emits_complete_event(self):
-        patches = _patch_all()
-        with patches["analyze"], patches["extract"], patches["match"], \
-             patches["reorder"], patches["inject"], patches["compile"], patches["flush"]:
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-                resp = await client.post(
-                    "/api/tailor-stream",
-                    data=_form_data(),
-                    files=_tex_upload(),
-                )
-        events = _parse_sse_events(resp.text)
+    async def test_stream_emits_complete_event(self, happy_events):
+        events = happy_events
         complete_events = [e for e in events if e["event"] == "complete"]
         assert len(complete_events) == 1
         data = complete_events[0]["data"]
@@ -236,34 +234,14 @@ class TestStreamHappyPath:
         assert "reorder_plan" in data
         assert data["match"]["match_score"] == 75
 
-    async def test_stream_complete_has_pdf(self):
-        patches = _patch_all()
-        with patches["analyze"], patches["extract"], patches["match"], \
-             patches["reorder"], patches["inject"], patches["compile"], patches["flush"]:
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-                resp = await client.post(
-                    "/api/tailor-stream",
-                    data=_form_data(),
-                    files=_tex_upload(),
-                )
-        events = _parse_sse_events(resp.text)
+    async def test_stream_complete_has_pdf(self, happy_events):
+        events = happy_events
         data = [e for e in events if e["event"] == "complete"][0]["data"]
         assert data["pdf_url"].endswith(".pdf")
         assert len(data["pdf_b64"]) > 0
 
-    async def test_progress_labels_are_meaningful(self):
-        patches = _patch_all()
-        with patches["analyze"], patches["extract"], patches["match"], \
-             patches["reorder"], patches["inject"], patches["compile"], patches["flush"]:
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-                resp = await client.post(
-                    "/api/tailor-stream",
-                    data=_form_data(),
-                    files=_tex_upload(),
-                )
-        events = _parse_sse_events(resp.text)
+    async def test_progress_labels_are_meaningful(self, happy_events):
+        events = happy_events
         labels = [e["data"]["label"] for e in events if e["event"] == "progress"]
         assert "Analyzing resume..." in labels
         assert "Compiling PDF..." in labels
@@ -274,111 +252,49 @@ class TestStreamHappyPath:
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 class TestStreamErrors:
 
-    async def test_analysis_failure_emits_error_event(self):
-        patches = _patch_all()
-        with patch(
-            "app.routes.tailor.analyze_uploaded_resume",
-            new_callable=AsyncMock,
-            return_value=None,
-        ), patches["extract"], patches["match"], patches["reorder"], \
-             patches["inject"], patches["compile"], patches["flush"]:
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-                resp = await client.post(
-                    "/api/tailor-stream",
-                    data=_form_data(),
-                    files=_tex_upload(),
-                )
+    @pytest.mark.parametrize("stage, stub, substr, step", [
+        pytest.param(
+            "analyze_uploaded_resume",
+            _async_const(None), "analysis", 0,
+            id="analysis",
+        ),
+        pytest.param(
+            "extract_keywords",
+            _async_const(None), "extraction", 1,
+            id="extraction",
+        ),
+        pytest.param(
+            "match_keywords",
+            _async_const(None), "matching", 2,
+            id="match",
+        ),
+        pytest.param(
+            "inject_into_latex",
+            _raises(ValueError("Bad LaTeX")), "latex", 4,
+            id="injection",
+        ),
+    ])
+    async def test_stage_failure_emits_error_event(
+        self, client, stub_tailor, stage, stub, substr, step,
+    ):
+        stub_tailor(stage, stub)
+        resp, events = await _collect_events(client)
         assert resp.status_code == 200  # Stream opened successfully
-        events = _parse_sse_events(resp.text)
         error_events = [e for e in events if e["event"] == "error"]
         assert len(error_events) == 1
-        assert "analysis" in error_events[0]["data"]["detail"].lower()
-        assert error_events[0]["data"]["step"] == 0
-
-    async def test_extraction_failure_emits_error_event(self):
-        patches = _patch_all()
-        with patches["analyze"], patch(
-            "app.routes.tailor.extract_keywords",
-            new_callable=AsyncMock,
-            return_value=None,
-        ), patches["match"], patches["reorder"], patches["inject"], \
-             patches["compile"], patches["flush"]:
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-                resp = await client.post(
-                    "/api/tailor-stream",
-                    data=_form_data(),
-                    files=_tex_upload(),
-                )
-        events = _parse_sse_events(resp.text)
-        error_events = [e for e in events if e["event"] == "error"]
-        assert len(error_events) == 1
-        assert "extraction" in error_events[0]["data"]["detail"].lower()
-        assert error_events[0]["data"]["step"] == 1
-
-    async def test_match_failure_emits_error_event(self):
-        patches = _patch_all()
-        with patches["analyze"], patches["extract"], patch(
-            "app.routes.tailor.match_keywords",
-            new_callable=AsyncMock,
-            return_value=None,
-        ), patches["reorder"], patches["inject"], patches["compile"], patches["flush"]:
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-                resp = await client.post(
-                    "/api/tailor-stream",
-                    data=_form_data(),
-                    files=_tex_upload(),
-                )
-        events = _parse_sse_events(resp.text)
-        error_events = [e for e in events if e["event"] == "error"]
-        assert len(error_events) == 1
-        assert "matching" in error_events[0]["data"]["detail"].lower()
-        assert error_events[0]["data"]["step"] == 2
+        assert substr in error_events[0]["data"]["detail"].lower()
+        assert error_events[0]["data"]["step"] == step
 
-    async def test_compile_failure_still_emits_complete(self):
+    async def test_compile_failure_still_emits_complete(self, client, stub_tailor):
         """PDF compilation failure is non-fatal — complete event still sent."""
-        patches = _patch_all()
-        with patches["analyze"], patches["extract"], patches["match"], \
-             patches["reorder"], patches["inject"], patch(
-                 "app.routes.tailor.compile_pdf",
-                 side_effect=RuntimeError("pdflatex not found"),
-             ), patches["flush"]:
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-                resp = await client.post(
-                    "/api/tailor-stream",
-                    data=_form_data(),
-                    files=_tex_upload(),
-                )
-        events = _parse_sse_events(resp.text)
+        stub_tailor("compile_pdf", _raises(RuntimeError("pdflatex not found")))
+        _, events = await _collect_events(client)
         error_events = [e for e in events if e["event"] == "error"]
         assert len(error_events) == 0  # No error — just no PDF
         complete_events = [e for e in events if e["event"] == "complete"]
         assert len(complete_events) == 1
         assert complete_events[0]["data"]["pdf_url"] == ""
         assert complete_events[0]["data"]["pdf_b64"] == ""
-
-    async def test_injection_failure_emits_error_event(self):
-        patches = _patch_all()
-        with patches["analyze"], patches["extract"], patches["match"], \
-             patches["reorder"], patch(
-                 "app.routes.tailor.inject_into_latex",
-                 side_effect=ValueError("Bad LaTeX"),
-             ), patches["compile"], patches["flush"]:
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-                resp = await client.post(
-                    "/api/tailor-stream",
-                    data=_form_data(),
-                    files=_tex_upload(),
-                )
-        events = _parse_sse_events(resp.text)
-        error_events = [e for e in events if e["event"] == "error"]
-        assert len(error_events) == 1
-        assert "latex" in error_events[0]["data"]["detail"].lower()
-        assert error_events[0]["data"]["step"] == 4